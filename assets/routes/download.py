@@ -9,7 +9,7 @@ download process, validate requests, and handle errors.
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 
 from user_management.routes.lib import get_current_user
 from user_management.src.admin import Admin
@@ -109,7 +109,10 @@ async def get_analysis_report(
       extracted from the access token.
 
     Returns:
-    - FileResponse: A response containing the analysis report file to be downloaded.
+    - FileResponse: A response containing the analysis report file to be downloaded,
+      or a 202 response with the task id while the report is still being rendered.
+      Renders are tracked per process, so only the worker that queued a render
+      reports it as pending; other workers serve the last completed report, if any.
 
     Raises:
     - HTTPException: If the analysis report is not found.
@@ -119,11 +122,16 @@ async def get_analysis_report(
             status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized"
         )
     try:
-        file_path, filename = AssetDownload(candidate_id).get_analysis_report()
+        report, filename = AssetDownload(candidate_id).get_analysis_report()
     except FileNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    if report.task_id is not None:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"task_id": report.task_id, "status": "pending"},
+        )
     return FileResponse(
-        file_path,
+        report.file_path,
         media_type="application/pdf",
         filename=filename,
     )
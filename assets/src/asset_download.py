@@ -14,6 +14,7 @@ from typing import Tuple
 from dotenv import load_dotenv
 
 from commons import FileName, logger, DBEnterExitMixin
+from reporting.src.interview_summary import InterviewSummary, PdfReport
 
 load_dotenv()
 FILES_DIR = os.environ.get("FILES_DIR")
@@ -106,29 +107,30 @@ class AssetDownload(DBEnterExitMixin):
             )
         return zip_file_path
 
-    def get_analysis_report(self) -> Tuple[str, str]:
+    def get_analysis_report(self) -> Tuple[PdfReport, str]:
         """
         Retrieve the analysis report for a candidate.
 
-        This method locates and returns the path to the analysis report
-        for a specific candidate. The report is stored as a PDF file
-        in the candidate's directory.
+        This method locates the analysis report for a specific candidate,
+        through InterviewSummary so a report still being rendered is not
+        served. The report is stored as a PDF file in the candidate's
+        directory.
 
         Returns:
-            Tuple[str, str]: A tuple containing:
-                - str: The full path to the analysis report file
+            Tuple[PdfReport, str]: A tuple containing:
+                - PdfReport: The path to the analysis report file, or the task
+                  id of the render while it is still running
                 - str: The filename for download purposes
 
         Raises:
             FileNotFoundError: If the analysis report file is not found
         """
-        file_path = os.path.join(
-            FILES_DIR, str(self.candidate_id), f"{FileName.ANALYSIS_REPORT.value}.pdf"
-        )
-        if not os.path.exists(file_path):
+        try:
+            report = InterviewSummary.get_pdf_report(self.candidate_id)
+        except FileNotFoundError:
             logger.error(
                 "Analysis report not found for candidate ID: %s", self.candidate_id
             )
-            raise FileNotFoundError("Analysis report not found !")
+            raise
         download_filename = f"{self.candidate_id}_{FileName.ANALYSIS_REPORT.value}.pdf"
-        return file_path, download_filename
+        return report, download_filename
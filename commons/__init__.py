@@ -1,5 +1,6 @@
 """Commons package with common utilities and helpers for the project."""
 
+from commons.src.cache_helper import CacheHelper
 from commons.src.config_loader import ConfigLoader
 from commons.src.db_enter_exit_mixin import DBEnterExitMixin
 from commons.src.db_generic import Database
@@ -8,4 +9,5 @@ from commons.src.exceptions import *
 from commons.src.log_helper import create_log_file, logger
 from commons.src.mariadb_helper import MariaDBHelper
 from commons.src.models import Base
-from commons.src.enums import FileName, InterviewStatus
+from commons.src.redis_client import redis_client
+from commons.src.enums import CacheNamespace, FileName, InterviewStatus, UserRole
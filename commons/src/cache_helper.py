@@ -0,0 +1,113 @@
+"""TTL caches shared across the service."""
+
+import threading
+
+import orjson
+from cachetools import TTLCache
+from redis import RedisError
+
+from commons.src.enums import CacheNamespace
+from commons.src.log_helper import logger
+from commons.src.redis_client import redis_client
+
+# Cached in Redis so every worker sees the same entries and a clear made by
+# one worker reaches all of them. Values must be JSON serializable.
+SHARED_NAMESPACES = frozenset({CacheNamespace.REPORTING, CacheNamespace.DASHBOARD})
+REDIS_KEY_PREFIX = "cache:"
+REDIS_SCAN_COUNT = 1000
+
+
+class CacheHelper:
+    """Registry of namespaced TTL caches.
+
+    Each namespace owns one ``TTLCache`` so that write paths can invalidate
+    everything cached for a feature (e.g. all reporting responses) at once.
+    The SHARED_NAMESPACES are kept in Redis instead, under
+    ``cache:<namespace>:<key>``. When Redis can't be reached they behave as
+    an empty cache.
+    """
+
+    _caches = {}
+    _ttls = {}
+    _lock = threading.RLock()
+
+    @classmethod
+    def get_cache(
+        cls, namespace: CacheNamespace, maxsize: int = 1024, ttl: int = 300
+    ) -> TTLCache:
+        """Get (or create) the cache for the given namespace."""
+        with cls._lock:
+            if namespace not in cls._caches:
+                cls._caches[namespace] = TTLCache(maxsize=maxsize, ttl=ttl)
+                cls._ttls[namespace] = ttl
+            return cls._caches[namespace]
+
+    @staticmethod
+    def __redis_key(namespace: CacheNamespace, key) -> str:
+        if isinstance(key, tuple):
+            key = ":".join(map(str, key))
+        return f"{REDIS_KEY_PREFIX}{namespace.value}:{key}"
+
+    @classmethod
+    def get(cls, namespace: CacheNamespace, key):
+        """Return the cached value for the key, or None on a miss."""
+        if namespace in SHARED_NAMESPACES:
+            try:
+                value = redis_client.get(cls.__redis_key(namespace, key))
+            except RedisError as e:
+                logger.warning("Cache read from Redis failed: %s", e)
+                return None
+            return None if value is None else orjson.loads(value)
+        with cls._lock:
+            return cls.get_cache(namespace).get(key)
+
+    @classmethod
+    def set(cls, namespace: CacheNamespace, key, value) -> None:
+        """Store the value under the key in the given namespace."""
+        if namespace in SHARED_NAMESPACES:
+            cls.get_cache(namespace)  # Registers the default TTL if unset
+            try:
+                redis_client.setex(
+                    cls.__redis_key(namespace, key),
+                    cls._ttls[namespace],
+                    orjson.dumps(value),
+                )
+            except RedisError as e:
+                logger.warning("Cache write to Redis failed: %s", e)
+            return
+        with cls._lock:
+            cls.get_cache(namespace)[key] = value
+
+    @classmethod
+    def pop(cls, namespace: CacheNamespace, key) -> None:
+        """Drop the entry cached under the key, if any."""
+        if namespace in SHARED_NAMESPACES:
+            try:
+                redis_client.delete(cls.__redis_key(namespace, key))
+            except RedisError as e:
+                logger.warning("Cache delete in Redis failed: %s", e)
+            return
+        with cls._lock:
+            cls.get_cache(namespace).pop(key, None)
+
+    @classmethod
+    def clear(cls, namespace: CacheNamespace) -> None:
+        """Drop every entry cached under the given namespace."""
+        logger.debug("Clearing %s cache..", namespace.value)
+        if namespace in SHARED_NAMESPACES:
+            try:
+                keys = list(
+                    redis_client.scan_iter(
+                        match=f"{REDIS_KEY_PREFIX}{namespace.value}:*",
+                        count=REDIS_SCAN_COUNT,
+                    )
+                )
+                if keys:
+                    redis_client.unlink(*keys)
+            except RedisError as e:
+                # Other workers keep the entries until their TTL expires
+                logger.error("Clearing %s cache failed: %s", namespace.value, e)
+            return
+        with cls._lock:
+            if namespace in cls._caches:
+                cls._caches[namespace].clear()
@@ -1,6 +1,7 @@
 """ Config loader. """
 
-import json
+import orjson
+
 from commons.src.log_helper import logger
 
 
@@ -12,9 +13,8 @@ class ConfigLoader:
     @classmethod
     def get_config(cls, config_path: str):
         """Get config."""
-        logger.info("Loading config from %s", config_path)
-
         if config_path not in cls._instances:
-            with open(config_path, "r", encoding="utf-8") as f:
-                cls._instances[config_path] = json.load(f)
+            logger.info("Loading config from %s", config_path)
+            with open(config_path, "rb") as f:
+                cls._instances[config_path] = orjson.loads(f.read())
         return cls._instances[config_path]
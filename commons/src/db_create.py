@@ -11,6 +11,12 @@ generic_db = Database(db_schema="cwintwagent", env="DEV")
 try:
     Base.metadata.create_all(bind=generic_db.engine)
     logger.info("Tables created successfully.")
+    # create_all skips tables that already exist, so add any indexes declared
+    # after the table was first created.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=generic_db.engine, checkfirst=True)
+    logger.info("Indexes created successfully.")
 except Exception as err:
     logger.exception("An error occurred while creating tables: %s", err)
     raise
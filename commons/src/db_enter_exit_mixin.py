@@ -17,22 +17,35 @@ class DBEnterExitMixin:
     ----------
     _db_session : object
         The current database session.
+    _read_only : bool
+        Whether sessions should use the read replica, if one is configured.
     Methods
     -------
     __enter__()
         Enters a database session.
     __exit__(exc_type, exc_val, exc_tb)
-        Exits a database session, handling exceptions and rollbacks as needed.
+        Exits a database session, committing on success and rolling back on
+        exceptions.
     """
 
+    _read_only = False
+
     def __enter__(self):
         self._db_helper = self._db_helper or Database(
-            db_schema="cwintwagent", db_name="MariaDB", env="DEV"
+            db_schema="cwintwagent",
+            db_name="MariaDB",
+            env="DEV",
+            read_only=self._read_only,
         )
         self._db_session = self._db_helper.session()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         logger.info("Closing DB session..")
-        self._db_session.close()
-        if exc_type is not None:
-            self._db_session.rollback()
+        try:
+            if exc_type is None:
+                # Commit whatever the block left pending
+                self._db_session.commit()
+            else:
+                self._db_session.rollback()
+        finally:
+            self._db_session.close()
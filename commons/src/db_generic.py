@@ -14,14 +14,19 @@ class Database(metaclass=SingletonMeta):
     """Generic class to connect to the database using SQLAlchemy."""
 
     __CONFIG_PATH = os.path.join("commons", "db_details.json")
+    # Size of SQLAlchemy's compiled SQL cache, per engine
+    __QUERY_CACHE_SIZE = 1200
 
-    def __init__(self, db_schema: str, db_name="MariaDB", env="PROD"):
+    def __init__(self, db_schema: str, db_name="MariaDB", env="PROD", read_only=False):
         logger.info("Creating %s DB conn..", db_schema)
         self.__db_name = db_name
         self.__db_schema = db_schema
         self.__env = env.upper()
+        self.__read_only = read_only
         self.engine = self.__create_engine()
-        self.session = sessionmaker(bind=self.engine)
+        # Sessions commit when DBEnterExitMixin blocks exit and records are used
+        # after the session closes, so keep their loaded state on commit
+        self.session = sessionmaker(bind=self.engine, expire_on_commit=False)
 
     def __create_engine(self):
         """Create an engine to connect to the database.
@@ -31,7 +36,9 @@ class Database(metaclass=SingletonMeta):
         try:
             # print("conn_str: %s ", conn_str)
             logger.info('Connecting to "%s" database..', self.__db_schema)
-            engine = create_engine(conn_str, echo=True)
+            engine = create_engine(
+                conn_str, echo=True, query_cache_size=self.__QUERY_CACHE_SIZE
+            )
             return engine
         except Exception as err:
             logger.info("conn_str: %s ", conn_str)
@@ -40,7 +47,14 @@ class Database(metaclass=SingletonMeta):
 
     def __get_conn_str(self):
         db_details = ConfigLoader.get_config(self.__CONFIG_PATH)
-        conn_details = db_details[f"{self.__db_name}_{self.__env}"]
+        conn_key = f"{self.__db_name}_{self.__env}"
+        if self.__read_only:
+            # Read-only sessions go to the replica when one is configured
+            if f"{conn_key}_READ" in db_details:
+                conn_key = f"{conn_key}_READ"
+            else:
+                logger.info("No read replica for %s, using primary..", conn_key)
+        conn_details = db_details[conn_key]
         user, password, host, port = (
             conn_details["user"],
             conn_details["password"],
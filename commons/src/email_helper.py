@@ -44,12 +44,12 @@ class EmailHelper:
         self.__smtp_server.login(mail_username, mail_pass)
         logger.info("SMTP session created for %s", mail_username)
 
-    def __set_message(self, subject, html_content):
+    def __set_message(self, subject, html_content, email_address=None):
         # self.__msg = EmailMessage()
         self.__msg = MIMEMultipart("alternative")
         self.__msg["Subject"] = subject
         self.__msg["From"] = os.environ.get("MAIL_FROM")
-        self.__msg["To"] = self.__email
+        self.__msg["To"] = email_address or self.__email
 
         # Generate plain text from HTML
         h = html2text.HTML2Text()
@@ -70,18 +70,22 @@ class EmailHelper:
             print(1)
             logger.exception(str(e))
 
-    def send_candidate_invite(self, email_body):
+    def send_candidate_invite(self, email_body, email_address=None):
         """
         Send a candidate invite to the specified email address.
 
         Parameters:
             email_body (str): The HTML content of the email to be sent.
+            email_address (str, optional): The recipient, defaulting to the
+              address the helper was created for. Lets one SMTP session send
+              several invites.
 
         Returns:
             None
         """
-        self.__set_message("Candidate Invite", email_body)
+        email_address = email_address or self.__email
+        self.__set_message("Candidate Invite", email_body, email_address)
         # self.__msg.set_content(email_body)
-        logger.debug("Sending candidate invite to %s..", self.__email)
+        logger.debug("Sending candidate invite to %s..", email_address)
         self.__smtp_server.send_message(self.__msg)
-        logger.info("Candidate invite sent to %s", self.__email)
+        logger.info("Candidate invite sent to %s", email_address)
@@ -4,6 +4,8 @@ This module defines enumerations used throughout the application.
 It includes:
 - UploadFileTpe: An enumeration of file types that can be uploaded.
 - InterviewStatus: An enumeration of possible interview statuses.
+- CacheNamespace: An enumeration of in-process cache namespaces.
+- UserRole: An enumeration of user roles.
 """
 
 from enum import Enum
@@ -53,3 +55,31 @@ class InterviewStatus(Enum):
     REJECTED = "Rejected"
     SELECTED = "Selected"
     HIRED = "Hired"
+
+
+class CacheNamespace(Enum):
+    """
+    An enumeration of in-process cache namespaces.
+    Attributes:
+        REPORTING: Timeline data computed by Reports.
+        AUTH: Role and active flag of users, for authorization checks.
+        DASHBOARD: Interview counters of the admin dashboard.
+        PDF_JOBS: Background analysis PDF renders.
+    """
+
+    REPORTING = "reporting"
+    AUTH = "auth"
+    DASHBOARD = "dashboard"
+    PDF_JOBS = "pdf_jobs"
+
+
+class UserRole(Enum):
+    """
+    An enumeration of user roles.
+    Attributes:
+        CANDIDATE: A candidate taking interviews.
+        ADMIN: An admin managing candidates and interviews.
+    """
+
+    CANDIDATE = "Candidate"
+    ADMIN = "Admin"
@@ -0,0 +1,27 @@
+"""
+Redis client shared by the workers of the service.
+
+The service requires a Redis server, set with the REDIS_HOST and REDIS_PORT
+environment variables (default localhost:6379). It holds the revoked tokens
+and the shared caches. Authenticated requests are refused with a 503 while it
+can't be reached.
+"""
+
+import os
+
+import redis
+from dotenv import load_dotenv
+
+load_dotenv()
+REDIS_HOST = os.environ.get("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.get("REDIS_PORT", "6379"))
+# Bounded so a Redis outage fails requests instead of hanging workers
+REDIS_TIMEOUT_SECONDS = 2
+
+# Connects lazily, on the first command
+redis_client = redis.Redis(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    socket_timeout=REDIS_TIMEOUT_SECONDS,
+    socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+)
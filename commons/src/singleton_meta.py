@@ -13,8 +13,7 @@ class SingletonMeta(ABCMeta):
     _instances = {}
 
     def __call__(cls, *args, **kwargs):
-        if kwargs.get("db_name") not in cls._instances:
-            cls._instances[kwargs.get("db_name")] = super(SingletonMeta, cls).__call__(
-                *args, **kwargs
-            )
-        return cls._instances[kwargs.get("db_name")]
+        key = (kwargs.get("db_name"), kwargs.get("read_only", False))
+        if key not in cls._instances:
+            cls._instances[key] = super(SingletonMeta, cls).__call__(*args, **kwargs)
+        return cls._instances[key]
@@ -52,20 +52,30 @@ async def schedule_interview(
         raise HTTPException(status_code=400, detail="No candidates specified")
 
     admin_obj = Admin(admin_id)
-    candidate_not_found_list, docs_not_found_list, scheduled_list = [], [], []
+    candidate_not_found_list, docs_not_found_list, ready_list = [], [], []
     for candidate_id in candidate_id_info.id_list:
         try:
             interview_obj = InterviewManager(candidate_id)
             if not interview_obj.pre_requisites():
                 docs_not_found_list.append(candidate_id)
                 continue
-            admin_obj.invite_candidate(candidate_id)
-            scheduled_list.append(candidate_id)
-        except PermissionError as e:
-            raise HTTPException(status_code=403, detail=str(e)) from e
+            ready_list.append(candidate_id)
         except RecordNotFoundException:
             candidate_not_found_list.append(candidate_id)
 
+    scheduled_list = []
+    if ready_list:
+        # Invite in one batch: one transaction and one SMTP session
+        try:
+            scheduled_list = admin_obj.invite_candidates(ready_list)
+        except PermissionError as e:
+            raise HTTPException(status_code=403, detail=str(e)) from e
+        candidate_not_found_list.extend(
+            candidate_id
+            for candidate_id in ready_list
+            if candidate_id not in scheduled_list
+        )
+
     response_messages = []
     if candidate_not_found_list:
         response_messages.append(
@@ -23,7 +23,14 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
-from commons import DBEnterExitMixin, FileName, InterviewStatus, logger
+from commons import (
+    CacheHelper,
+    CacheNamespace,
+    DBEnterExitMixin,
+    FileName,
+    InterviewStatus,
+    logger,
+)
 from interview.src.models import InterviewORM
 from interview.src.prompt import INSTRUCTIONS
 from user_management.src.candidate import Candidate
@@ -67,6 +74,8 @@ class InterviewManager(DBEnterExitMixin):
                     {"status": InterviewStatus.COMPLETED.value}
                 )
                 self._db_session.commit()
+            CacheHelper.clear(CacheNamespace.REPORTING)
+            CacheHelper.clear(CacheNamespace.DASHBOARD)
             self.__candidate.deactivate()
 
     def move_status_to_in_progress(self):
@@ -6,7 +6,7 @@ It defines the database schema and ORM classes for managing interviews.
 from datetime import datetime
 
 import pytz
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from commons import Base, InterviewStatus
@@ -17,6 +17,14 @@ class InterviewORM(Base):
     """ORM class for managing interviews."""
 
     __tablename__ = "Interviews"
+    __table_args__ = (
+        # Equality column first, range column second, for the reports range scan.
+        Index("ix_interview_status_dt", "status", "interview_datetime"),
+        # Latest interview per candidate lookups.
+        Index("ix_interview_candidate_dt", "candidate_id", "interview_datetime"),
+        # A candidate's interviews in a given status (invites, login expiry).
+        Index("ix_interview_candidate_status", "candidate_id", "status"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     candidate_id = Column(Integer, ForeignKey("Candidates.id"), nullable=False)
     status = Column(
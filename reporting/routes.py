@@ -1,25 +1,53 @@
 """Routes for reporting-related endpoints."""
 
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from reporting.src.reports import Reports
-from user_management.routes.lib import get_current_user
+import hashlib
+import json
+import os
+from typing import Annotated, List, Literal, Optional, get_args
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, Response
+
+from reporting.src.interview_summary import InterviewSummary
+from reporting.src.reports import CACHE_TTL_SECONDS, Reports
+from user_management.routes.lib import get_authorized_admin
 from user_management.src.admin import Admin
 
 router = APIRouter(tags=["reporting"], prefix="/reporting")
 
+# Validated by FastAPI, so an unknown duration is answered with a 422
+TimelineDuration = Literal["3 Months", "30 Days", "7 Days"]
+
+
+def _etag_response(request: Request, content) -> Response:
+    """
+    Build a JSON response carrying an ETag for the given content.
+
+    Returns an empty 304 response when the client already holds the same
+    representation (matching `If-None-Match` header).
+    """
+    content = jsonable_encoder(content)
+    body = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    etag = f'"{hashlib.md5(body.encode("utf-8")).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": f"private, max-age={CACHE_TTL_SECONDS}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return JSONResponse(content=content, headers=headers)
+
 
 @router.get("/dashboard", status_code=200)
-async def dashboard(user_id: Annotated[int, Depends(get_current_user)]):
+async def dashboard(
+    request: Request,
+    admin: Annotated[Admin, Depends(get_authorized_admin)],
+):
     """
-    Retrieves the dashboard information for the given user.
+    Retrieves the dashboard information for the given admin.
 
-    This endpoint retrieves the dashboard information for the given user.
+    This endpoint retrieves the dashboard information for the given admin.
 
     Args:
-        user_id (int): The ID of the user.
+        admin (Admin): The authorized admin resolved for the user.
 
     Returns:
         dict: A dictionary containing the dashboard information.
@@ -28,30 +56,29 @@ async def dashboard(user_id: Annotated[int, Depends(get_current_user)]):
         HTTPException: If the user does not have permission to access the dashboard.
     """
     # Can be refactored and moved to reporting/src/reports.py
+    # The counters are cached by Admin.get_dashboard
     try:
-        return Admin(user_id).get_dashboard()
+        return _etag_response(request, admin.get_dashboard())
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
 
 
-@router.get("/timeline", status_code=200)
+@router.get("/timeline", status_code=200, dependencies=[Depends(get_authorized_admin)])
 async def get_timeline_data(
-    admin_user_id: Annotated[int, Depends(get_current_user)],
+    request: Request,
     duration: Annotated[
-        str,
-        Query(
-            description="Time period: '3 months', '30 days', or '7 days'",
-            enum=["3 Months", "30 Days", "7 Days"],
-        ),
+        TimelineDuration,
+        Query(description="Time period: '3 months', '30 days', or '7 days'"),
     ] = "3 Months",
 ):
     """
-    Retrieves the timeline data for the given user.
+    Retrieves the timeline data.
 
-    This endpoint retrieves the timeline data for the given user.
+    This endpoint retrieves the completed interviews timeline, which is the
+    same for every admin and is cached by Reports.
 
     Args:
-        user_id (int): The ID of the user.
+        duration (str): The time period of the timeline.
 
     Returns:
         dict: A dictionary containing the timeline data.
@@ -59,13 +86,82 @@ async def get_timeline_data(
     Raises:
         HTTPException: If the user does not have permission to access the timeline data.
     """
-    if not Admin(admin_user_id).is_authorized():
-        raise HTTPException(status_code=403, detail="Unauthorized")
     try:
         reports = Reports()
         if "Days" in duration:
-            return reports.get_completed_interviews_counts_by_days(duration=duration)
-        return reports.get_completed_interviews_counts_by_month(duration=duration)
+            data = reports.get_completed_interviews_counts_by_days(duration=duration)
+        else:
+            data = reports.get_completed_interviews_counts_by_month(duration=duration)
+        return _etag_response(request, data)
 
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
+
+
+@router.get("/timelines", status_code=200, dependencies=[Depends(get_authorized_admin)])
+async def get_timelines_data(
+    request: Request,
+    durations: Annotated[
+        Optional[List[TimelineDuration]],
+        Query(
+            alias="duration",
+            description="Time periods: '3 months', '30 days', or '7 days'; all by default",
+        ),
+    ] = None,
+):
+    """
+    Retrieves the timeline data for several durations in one call.
+
+    All durations are fetched with a single database round trip.
+
+    Args:
+        durations (List[str], optional): The time periods to fetch, defaulting
+            to all of them.
+
+    Returns:
+        dict: The timeline data keyed by duration.
+    """
+    data = Reports().get_completed_interviews_timelines(
+        durations or list(get_args(TimelineDuration))
+    )
+    return _etag_response(request, data)
+
+
+@router.get(
+    "/analysis/{candidate_id}/pdf",
+    status_code=200,
+    dependencies=[Depends(get_authorized_admin)],
+)
+async def get_analysis_pdf(candidate_id: int):
+    """
+    Retrieves the analysis report PDF for the given candidate.
+
+    The PDF is rendered in the background after the interview summary is
+    generated; until it is ready this endpoint answers with 202. Renders are
+    tracked per process, so only the worker that queued a render reports it
+    as pending; other workers serve the last completed PDF, if any.
+
+    Args:
+        candidate_id (int): The ID of the candidate.
+
+    Returns:
+        FileResponse: The analysis report PDF, or a 202 response with the task
+        id while the PDF is still being rendered.
+
+    Raises:
+        HTTPException: If no analysis report exists for the candidate.
+    """
+    try:
+        report = InterviewSummary.get_pdf_report(candidate_id)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    if report.task_id is not None:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"task_id": report.task_id, "status": "pending"},
+        )
+    return FileResponse(
+        report.file_path,
+        media_type="application/pdf",
+        filename=f"{candidate_id}_{os.path.basename(report.file_path)}",
+    )
@@ -16,10 +16,10 @@ template to produce a professional-looking HTML report that can be viewed in a w
 browser or converted to PDF.
 """
 
-import math
 import os
 from typing import Any, Dict, List
 
+import numpy as np
 from jinja2 import Template
 
 from user_management import Candidate
@@ -82,41 +82,57 @@ class Formatter:
         #     (100, 0),
         # ]
 
-        def polar_to_cartesian(cx, cy, radius, angle_deg):
-            """Convert polar coordinates to Cartesian. In SVG, Y increases downward."""
-            rad = math.radians(angle_deg)
-            x = cx + radius * math.cos(rad)
-            y = cy - radius * math.sin(rad)
-            return x, y
+        # Compute the needle angle: 180° at 0% → 0° at 100%.
+        needle_angle = 180.0 - (percentage * 180.0 / 100.0)
+        needle_len = r - 10  # Needle length (proportionate to gauge size)
+        pointer_width = 12
+        perp_angle = needle_angle + 90  # Perpendicular to the needle
+        base_offset = pointer_width / 2
 
-        def arc_path(cx, cy, radius, angle_start, angle_end):
-            """Return the SVG path for an arc from angle_start to angle_end (in degrees)."""
-            start_x, start_y = polar_to_cartesian(cx, cy, radius, angle_start)
-            end_x, end_y = polar_to_cartesian(cx, cy, radius, angle_end)
-            return f"M {start_x:.2f},{start_y:.2f} A {radius},{radius} 0 0 1 {end_x:.2f},{end_y:.2f}"
+        # Convert every polar point of the gauge to Cartesian in one pass.
+        # Layout: segment starts, segment ends, segment midpoints (all at r),
+        # then needle tip, needle base left and needle base right.
+        n_seg = len(segments)
+        angles = np.array(
+            [seg["start"] for seg in segments]
+            + [seg["end"] for seg in segments]
+            + [(seg["start"] + seg["end"]) / 2 for seg in segments]
+            + [needle_angle, perp_angle, perp_angle - 180],
+            dtype=float,
+        )
+        radii = np.array([r] * (3 * n_seg) + [needle_len, base_offset, base_offset])
+        rads = np.radians(angles)
+        # In SVG, Y increases downward.
+        xs = cx + radii * np.cos(rads)
+        ys = cy - radii * np.sin(rads)
+        starts = range(0, n_seg)
+        ends = range(n_seg, 2 * n_seg)
+        mids = range(2 * n_seg, 3 * n_seg)
+        tip, base_left, base_right = 3 * n_seg, 3 * n_seg + 1, 3 * n_seg + 2
 
         svg_parts = [
             f'<svg viewBox="0 0 {svg_width} {svg_height}" width="{svg_width}" height="{svg_height}"class="gauge-svg">'
         ]
 
         # Draw each colored arc segment (with butt linecaps to preserve gaps).
-        for seg in segments:
-            d = arc_path(cx, cy, r, seg["start"], seg["end"])
+        for seg, i_start, i_end in zip(segments, starts, ends):
+            d = (
+                f"M {xs[i_start]:.2f},{ys[i_start]:.2f} A {r},{r} 0 0 1 "
+                f"{xs[i_end]:.2f},{ys[i_end]:.2f}"
+            )
             svg_parts.append(
                 f'<path d="{d}" fill="none" stroke="{seg["color"]}" '
                 f'stroke-width="{stroke_w}" stroke-linecap="butt" />'
             )
 
         # Add circles at the endpoints to simulate rounded ends.
-        first_seg = segments[0]
-        start_point = polar_to_cartesian(cx, cy, r, first_seg["start"])
+        first_seg, i_first = segments[0], starts[0]
         svg_parts.append(
-            f'<circle cx="{start_point[0]:.2f}" cy="{start_point[1]:.2f}" r="{stroke_w/2}" fill="{first_seg["color"]}" />'
+            f'<circle cx="{xs[i_first]:.2f}" cy="{ys[i_first]:.2f}" r="{stroke_w/2}" fill="{first_seg["color"]}" />'
         )
-        last_seg = segments[-1]
-        end_point = polar_to_cartesian(cx, cy, r, last_seg["end"])
+        last_seg, i_last = segments[-1], ends[-1]
         svg_parts.append(
-            f'<circle cx="{end_point[0]:.2f}" cy="{end_point[1]:.2f}" r="{stroke_w/2}" fill="{last_seg["color"]}" />'
+            f'<circle cx="{xs[i_last]:.2f}" cy="{ys[i_last]:.2f}" r="{stroke_w/2}" fill="{last_seg["color"]}" />'
         )
 
         # Draw numeric boundary labels (0,20,40,60,80,100) inside the gauge.
@@ -133,27 +149,15 @@ class Formatter:
 
         # Place segment labels inside each colored arc.
         # Using radius: r so that the text appears at the center of the stroke.
-        for seg in segments:
-            mid_angle = (seg["start"] + seg["end"]) / 2
-            x_mid, y_mid = polar_to_cartesian(cx, cy, r, mid_angle)
+        for seg, i_mid in zip(segments, mids):
             svg_parts.append(
-                f'<text x="{x_mid:.2f}" y="{y_mid:.2f}" text-anchor="middle" dominant-baseline="middle" '
+                f'<text x="{xs[i_mid]:.2f}" y="{ys[i_mid]:.2f}" text-anchor="middle" dominant-baseline="middle" '
                 f'font-size="12" fill="#fff" font-weight="bold">{seg["label"]}</text>'
             )
 
-        # Compute the needle angle: 180° at 0% → 0° at 100%.
-        needle_angle = 180.0 - (percentage * 180.0 / 100.0)
-        needle_len = r - 10  # Needle length (proportionate to gauge size)
-        x2, y2 = polar_to_cartesian(cx, cy, needle_len, needle_angle)
-
         # Draw a sharp needle pointer as a triangle.
-        pointer_width = 12
-        perp_angle = needle_angle + 90  # Perpendicular to the needle
-        base_offset = pointer_width / 2
-        base_left = polar_to_cartesian(cx, cy, base_offset, perp_angle)
-        base_right = polar_to_cartesian(cx, cy, base_offset, perp_angle - 180)
         svg_parts.append(
-            f'<polygon points="{x2:.2f},{y2:.2f} {base_left[0]:.2f},{base_left[1]:.2f} {base_right[0]:.2f},{base_right[1]:.2f}" '
+            f'<polygon points="{xs[tip]:.2f},{ys[tip]:.2f} {xs[base_left]:.2f},{ys[base_left]:.2f} {xs[base_right]:.2f},{ys[base_right]:.2f}" '
             f'fill="#333" />'
         )
 
@@ -178,74 +182,48 @@ class Formatter:
             encoding="utf-8",
         ) as f:
             html_template = Template(f.read())
-        return html_template.render(
-            candidate_name=self.candidate.user_profile.name,
-            candidate_id=self.candidate.user_id,
-            clarity_score=self.input_json["Speech Analysis"]["Clarity"]["score"] * 10,
-            clarity_text=self.input_json["Speech Analysis"]["Clarity"]["reasoning"],
-            fluency_score=self.input_json["Speech Analysis"]["Fluency"]["score"] * 10,
-            fluency_text=self.input_json["Speech Analysis"]["Fluency"]["reasoning"],
-            pronunciation_score=self.input_json["Speech Analysis"]["Pronunciation"][
-                "score"
-            ]
+        speech = self.input_json["Speech Analysis"]
+        competency = self.input_json["Competency Analysis"]
+        grammar = self.input_json["Grammar & Diction"]
+        facial = self.input_json["Facial Expression Analysis"]
+        overall = self.input_json["Overall Result"]
+        context = {
+            "candidate_name": self.candidate.user_profile.name,
+            "candidate_id": self.candidate.user_id,
+            "clarity_score": speech["Clarity"]["score"] * 10,
+            "clarity_text": speech["Clarity"]["reasoning"],
+            "fluency_score": speech["Fluency"]["score"] * 10,
+            "fluency_text": speech["Fluency"]["reasoning"],
+            "pronunciation_score": speech["Pronunciation"]["score"] * 10,
+            "pronunciation_text": speech["Pronunciation"]["reasoning"],
+            "technical_proficiency_score": competency["Technical Proficiency"]["score"]
             * 10,
-            pronunciation_text=self.input_json["Speech Analysis"]["Pronunciation"][
+            "technical_proficiency_text": competency["Technical Proficiency"][
                 "reasoning"
             ],
-            technical_proficiency_score=self.input_json["Competency Analysis"][
-                "Technical Proficiency"
-            ]["score"]
-            * 10,
-            technical_proficiency_text=self.input_json["Competency Analysis"][
-                "Technical Proficiency"
-            ]["reasoning"],
-            contextual_application_score=self.input_json["Competency Analysis"][
-                "Contextual Application"
-            ]["score"]
-            * 10,
-            contextual_application_text=self.input_json["Competency Analysis"][
-                "Contextual Application"
-            ]["reasoning"],
-            articulation_score=self.input_json["Grammar & Diction"]["Articulation"][
+            "contextual_application_score": competency["Contextual Application"][
                 "score"
             ]
             * 10,
-            articulation_text=self.input_json["Grammar & Diction"]["Articulation"][
+            "contextual_application_text": competency["Contextual Application"][
                 "reasoning"
             ],
-            conciseness_score=self.input_json["Grammar & Diction"][
-                "Clarity & Conciseness"
-            ]["score"]
-            * 10,
-            conciseness_text=self.input_json["Grammar & Diction"][
-                "Clarity & Conciseness"
-            ]["reasoning"],
-            grammar_score=self.input_json["Grammar & Diction"]["Grammar & Vocabulary"][
-                "score"
-            ]
-            * 10,
-            grammar_text=self.input_json["Grammar & Diction"]["Grammar & Vocabulary"][
-                "reasoning"
-            ],
-            facial_expression_score=self.input_json["Facial Expression Analysis"][
-                "score"
-            ]
-            * 10,
-            facial_expression_overall_impression=self.input_json[
-                "Facial Expression Analysis"
-            ]["Overall Impression"],
-            facial_expression_specific_observations=self.input_json[
-                "Facial Expression Analysis"
-            ]["Specific Observations"],
-            facial_expression_final_assessment=self.input_json[
-                "Facial Expression Analysis"
-            ]["Final Assessment"],
-            overall_summary=self.input_json["Overall Result"]["Summary"],
-            recommendations=self.input_json["Overall Result"]["Recommendations"],
-            gauge_svg=self.__gauge_svg(
-                self.input_json["Overall Result"]["Overall Score"] * 10
-            ),
-            qa_table_rows=self.__generate_qa_table_html(
+            "articulation_score": grammar["Articulation"]["score"] * 10,
+            "articulation_text": grammar["Articulation"]["reasoning"],
+            "conciseness_score": grammar["Clarity & Conciseness"]["score"] * 10,
+            "conciseness_text": grammar["Clarity & Conciseness"]["reasoning"],
+            "grammar_score": grammar["Grammar & Vocabulary"]["score"] * 10,
+            "grammar_text": grammar["Grammar & Vocabulary"]["reasoning"],
+            "facial_expression_score": facial["score"] * 10,
+            "facial_expression_overall_impression": facial["Overall Impression"],
+            "facial_expression_specific_observations": facial["Specific Observations"],
+            "facial_expression_final_assessment": facial["Final Assessment"],
+            "overall_summary": overall["Summary"],
+            "recommendations": overall["Recommendations"],
+            "gauge_svg": self.__gauge_svg(overall["Overall Score"] * 10),
+            "qa_table_rows": self.__generate_qa_table_html(
                 self.input_json["Q&A Similarity Analysis"]["table"]
             ),
-        )
+        }
+        # Jinja2 accepts the context dict positionally; avoids a **kwargs rebuild
+        return html_template.render(context)
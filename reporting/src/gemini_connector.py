@@ -4,13 +4,16 @@ Connects to the Gemini API.
 Provides methods for authentication and data retrieval.
 """
 
-import json
+import mimetypes
 import os
+from functools import lru_cache
 from typing import List
 
+import orjson
 from dotenv import load_dotenv
 from google import genai
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 from google.genai import types
 
 from commons import ConfigLoader, logger
@@ -18,6 +21,16 @@ from commons import ConfigLoader, logger
 load_dotenv(override=True)
 
 FILES_DIR = os.environ.get("FILES_DIR")
+UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024  # 32 MiB
+UPLOAD_BUFFER_SIZE = 8 * 1024 * 1024  # 8 MiB
+
+_CONFIG = ConfigLoader.get_config(os.path.join("commons", "config.jsonc"))
+
+
+@lru_cache(maxsize=1)
+def _get_client() -> genai.Client:
+    """Return the process-wide Gemini client, shared across connectors."""
+    return genai.Client(vertexai=True, project=_CONFIG["gcp_project"])
 
 
 class GeminiConnector:
@@ -29,11 +42,9 @@ class GeminiConnector:
         __bucket_name (str): The name of the GCS bucket to upload files to.
     """
 
-    __CONFIG_PATH = os.path.join("commons", "config.jsonc")
-
     def __init__(self):
-        self.__config = ConfigLoader.get_config(self.__CONFIG_PATH)
-        self.client = genai.Client(vertexai=True, project=self.__config["gcp_project"])
+        self.__config = _CONFIG
+        self.client = _get_client()
         self.__bucket_name = self.__config["gcp_bucket"]
 
     def upload_file_to_gcs(self, file_path: str, prefix: str):
@@ -42,8 +53,17 @@ class GeminiConnector:
         storage_client = storage.Client()
         bucket = storage_client.bucket(self.__bucket_name)
         blob = bucket.blob(f"{prefix}_{os.path.basename(file_path)}")
-        blob.chunk_size = 50 * 1024 * 1024  # 50 MB
-        blob.upload_from_filename(file_path, timeout=600)
+        # Resumable chunks must be a multiple of 256 KiB
+        blob.chunk_size = UPLOAD_CHUNK_SIZE
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        with open(file_path, "rb", buffering=UPLOAD_BUFFER_SIZE) as fp:
+            blob.upload_from_file(
+                fp,
+                size=os.path.getsize(file_path),
+                content_type=content_type,
+                timeout=600,
+                retry=DEFAULT_RETRY,
+            )
         return f"gs://{self.__bucket_name}/{prefix}_{os.path.basename(file_path)}"
 
     def get_response(self, contents: List[str]):
@@ -56,12 +76,8 @@ class GeminiConnector:
         Returns:
             str: The response from the model.
         """
-        with open(
-            os.path.join("reporting", "src", "response_schema.json"),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            response_schema = json.load(f)
+        with open(os.path.join("reporting", "src", "response_schema.json"), "rb") as f:
+            response_schema = orjson.loads(f.read())
         generate_content_config = types.GenerateContentConfig(
             temperature=0,
             top_p=0.95,
@@ -7,20 +7,67 @@ Classes:
 - InterviewSummary: Handles the saving and retrieval of interview summaries.
 """
 
-import json
 import os
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
 
+import orjson
 from docx import Document
 from google.genai.types import Part
 from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
-from commons import FileName, logger
+from commons import CacheHelper, CacheNamespace, FileName, logger
 from reporting.src.formatter import Formatter
 from reporting.src.gemini_connector import GeminiConnector
 from reporting.src.prompt import ANALYSIS_PROMPT
 from user_management import Candidate
 
 FILES_DIR = os.environ.get("FILES_DIR")
+# How long an unpolled render is tracked before it is forgotten
+PDF_JOB_TTL_SECONDS = 3600
+
+# Single worker: renders are serialized so the shared font configuration and
+# stylesheet are never used by two renders at once.
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf_render")
+# Holds each render's Future under its task id, and the task id of each
+# candidate's latest render under the candidate id.
+CacheHelper.get_cache(CacheNamespace.PDF_JOBS, ttl=PDF_JOB_TTL_SECONDS)
+_FONT_CONFIG = FontConfiguration()
+_PAGE_CSS = CSS(string="@page { size: A4 landscape; }", font_config=_FONT_CONFIG)
+# _PAGE_CSS = CSS(string="@page { size: A4 portrait; }", font_config=_FONT_CONFIG)
+
+
+def _render_pdf(html_content: str, output_pdf_file: str) -> str:
+    """
+    Render the HTML report to PDF. Runs on the PDF worker thread.
+
+    The PDF is written to a temporary file in the same directory and then
+    moved into place, so readers never see a partially written report.
+    """
+    fd, temp_pdf_file = tempfile.mkstemp(
+        suffix=".pdf", dir=os.path.dirname(output_pdf_file)
+    )
+    os.close(fd)
+    try:
+        HTML(string=html_content).write_pdf(
+            temp_pdf_file, stylesheets=[_PAGE_CSS], font_config=_FONT_CONFIG
+        )
+        os.replace(temp_pdf_file, output_pdf_file)
+    except BaseException:
+        os.remove(temp_pdf_file)
+        raise
+    logger.info("PDF file saved as %s", output_pdf_file)
+    return output_pdf_file
+
+
+class PdfReport(NamedTuple):
+    """A candidate's analysis PDF, or the task still rendering it."""
+
+    file_path: Optional[str] = None
+    task_id: Optional[str] = None
 
 
 class InterviewSummary:
@@ -119,12 +166,10 @@ class InterviewSummary:
         ]
 
     def __save_response(self, response: str):
-        json_response = json.loads(response)
+        json_response = orjson.loads(response)
         logger.info("Saving response...")
-        with open(
-            os.path.join(self.results_dir, "response.json"), "w", encoding="utf-8"
-        ) as f:
-            json.dump(json_response, f, indent=4)
+        with open(os.path.join(self.results_dir, "response.json"), "wb") as f:
+            f.write(orjson.dumps(json_response, option=orjson.OPT_INDENT_2))
         formatter = Formatter(json_response, self.__candidate)
         html_content = formatter()
 
@@ -133,12 +178,53 @@ class InterviewSummary:
             f.write(html_content)
         logger.info("HTML file saved as %s", output_html_file)
 
-        # Convert HTML to PDF
-        output_pdf_file = os.path.join(self.results_dir, "analysis.pdf")
-        css = CSS(string="@page { size: A4 landscape; }")
-        # css = CSS(string="@page { size: A4 portrait; }")
-        HTML(string=html_content).write_pdf(output_pdf_file, stylesheets=[css])
-        logger.info("PDF file saved as %s", output_pdf_file)
+        # Convert HTML to PDF in the background
+        output_pdf_file = os.path.join(
+            self.results_dir, f"{FileName.ANALYSIS_REPORT.value}.pdf"
+        )
+        task_id = uuid.uuid4().hex
+        CacheHelper.set(
+            CacheNamespace.PDF_JOBS,
+            task_id,
+            _PDF_EXECUTOR.submit(_render_pdf, html_content, output_pdf_file),
+        )
+        CacheHelper.set(CacheNamespace.PDF_JOBS, self.__candidate.user_id, task_id)
+        logger.info("PDF rendering queued for %s as %s", output_pdf_file, task_id)
+
+    @staticmethod
+    def get_pdf_report(candidate_id: int) -> PdfReport:
+        """
+        Return the candidate's analysis PDF once it is rendered.
+
+        Args:
+            candidate_id (int): The ID of the candidate.
+
+        Returns:
+            PdfReport: The path to the PDF, or the task id of the latest
+                render while it is still running in the background.
+
+        Raises:
+            FileNotFoundError: If no PDF exists or is being rendered for the candidate.
+        """
+        task_id = CacheHelper.get(CacheNamespace.PDF_JOBS, candidate_id)
+        job = CacheHelper.get(CacheNamespace.PDF_JOBS, task_id) if task_id else None
+        if job is not None:
+            if not job.done():
+                return PdfReport(task_id=task_id)
+            CacheHelper.pop(CacheNamespace.PDF_JOBS, task_id)
+            if job.exception() is not None:
+                logger.error(
+                    "PDF rendering %s failed for candidate %s: %s",
+                    task_id,
+                    candidate_id,
+                    job.exception(),
+                )
+        output_pdf_file = os.path.join(
+            FILES_DIR, str(candidate_id), f"{FileName.ANALYSIS_REPORT.value}.pdf"
+        )
+        if not os.path.exists(output_pdf_file):
+            raise FileNotFoundError("Analysis report not found !")
+        return PdfReport(file_path=output_pdf_file)
 
 
 if __name__ == "__main__":
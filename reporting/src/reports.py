@@ -3,63 +3,168 @@
 This module contains functions and classes for generating and managing reports in the reporting service.
 """
 
-from datetime import datetime, timedelta
-
-from commons import DBEnterExitMixin, InterviewStatus, logger
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import func, literal, select, union_all
+
+from commons import (
+    CacheHelper,
+    CacheNamespace,
+    DBEnterExitMixin,
+    InterviewStatus,
+    logger,
+)
 from interview import InterviewORM
 
+CACHE_TTL_SECONDS = 300
+CacheHelper.get_cache(CacheNamespace.REPORTING, ttl=CACHE_TTL_SECONDS)
+
+
+def _hourly_cache_key(method_name: str, duration: str) -> tuple:
+    """Build a cache key that rolls over at the top of every hour."""
+    return (method_name, duration, datetime.now().strftime("%Y-%m-%d-%H"))
+
 
 class Reports(DBEnterExitMixin):
     """
     This class provides methods for generating and managing reports in the reporting service.
     """
 
+    # Reports only read, so they can run on the read replica
+    _read_only = True
+
     def __init__(self):
         self._db_helper = None
 
     # def get_dashboard(self):
     #     return Admin(self.user_id).get_dashboard()
 
-    def get_completed_interviews_counts_by_days(self, duration: str) -> dict:
+    @staticmethod
+    def __timeline_window(
+        duration: str, end_date: datetime
+    ) -> Tuple[datetime, Dict[date, str], bool]:
         """
-        Fetches the completed interviews counts for the given duration.
+        Work out the buckets of a timeline duration.
 
         Args:
-            duration (str): The duration for which to fetch the completed interviews counts.
+            duration (str): The duration, e.g. '30 Days' or '3 Months'.
+            end_date (datetime): The end of the timeline.
 
         Returns:
-            dict: A dictionary containing the completed interviews counts.
+            tuple: The start date, the bucket key for each bucket's first day and
+            whether the timeline is bucketed by month.
         """
-        logger.info("Fetching completed interviews counts for %s days...", duration)
-        days = int(duration.replace(" Days", ""))
+        if duration.endswith(" Days"):
+            days = int(duration.replace(" Days", ""))
+            start_date = end_date - timedelta(days=days)
+            # Format each date key once
+            key_by_date = {
+                day: day.strftime("%d-%b-%Y")
+                for day in (start_date.date() + timedelta(days=i) for i in range(days))
+            }
+            return start_date, key_by_date, False
 
+        months = int(duration.replace(" Months", ""))
+        # Set start_date to the first day of the month 'months' ago
+        start_date = datetime(end_date.year, end_date.month, 1) - relativedelta(
+            months=months - 1
+        )
+        # Prepare month keys in abbreviated month name and 2-digit year format
+        key_by_month = {}
+        for i in range(months):
+            month_start = start_date + relativedelta(months=i)
+            key_by_month[month_start.date()] = month_start.strftime("%b-%y")
+        return start_date, key_by_month, True
+
+    @staticmethod
+    def __timeline_query(
+        duration: str, start_date: datetime, end_date: datetime, by_month: bool
+    ):
+        """Build the per-bucket completed interview counts query for a duration."""
+        interview_year = func.year(InterviewORM.interview_datetime)
+        interview_month = func.month(InterviewORM.interview_datetime)
+        if by_month:
+            interview_day = literal(1)
+            group_by = (interview_year, interview_month)
+        else:
+            interview_day = func.dayofmonth(InterviewORM.interview_datetime)
+            group_by = (interview_year, interview_month, interview_day)
+        return (
+            select(
+                literal(duration).label("duration"),
+                interview_year.label("year"),
+                interview_month.label("month"),
+                interview_day.label("day"),
+                func.count(InterviewORM.id).label("count"),
+            )
+            .where(InterviewORM.status == InterviewStatus.COMPLETED.value)
+            .where(InterviewORM.interview_datetime >= start_date)
+            .where(InterviewORM.interview_datetime <= end_date)
+            .group_by(*group_by)
+        )
+
+    def get_completed_interviews_timelines(
+        self, durations: List[str]
+    ) -> Dict[str, List[dict]]:
+        """
+        Fetches the completed interviews counts for several durations at once.
+
+        All durations missing from the cache are fetched in a single UNION ALL
+        query, so a dashboard showing several timelines costs one round trip.
+
+        Args:
+            durations (List[str]): The durations, e.g. ['30 Days', '3 Months'].
+
+        Returns:
+            dict: The completed interviews counts for each duration.
+        """
+        logger.info("Fetching completed interviews counts for %s...", durations)
+        timelines = {}
+        windows = {}
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        # Create a dictionary with all dates initialized to 0
-        interview_counts = {
-            (start_date.date() + timedelta(days=i)).strftime("%d-%b-%Y"): 0
-            for i in range(days)
-        }
-        with self:
-            interviews = (
-                self._db_session.query(InterviewORM)
-                .filter(InterviewORM.status == InterviewStatus.COMPLETED.value)
-                .filter(InterviewORM.interview_datetime >= start_date)
-                .filter(InterviewORM.interview_datetime <= end_date)
-                .all()
+        for duration in dict.fromkeys(durations):
+            cached = CacheHelper.get(
+                CacheNamespace.REPORTING, _hourly_cache_key("timeline", duration)
             )
-            for interview in interviews:
-                if interview.interview_datetime:
-                    key = interview.interview_datetime.date().strftime("%d-%b-%Y")
-                    if key in interview_counts:
-                        interview_counts[key] += 1
-        return [
-            {"interview_date": i_date, "completed_count": count}
-            for i_date, count in sorted(interview_counts.items())
-        ]
+            if cached is not None:
+                timelines[duration] = cached
+            else:
+                windows[duration] = self.__timeline_window(duration, end_date)
+
+        if windows:
+            # Initialize all counts to 0
+            interview_counts = {
+                duration: {key: 0 for key in key_by_period.values()}
+                for duration, (_, key_by_period, _) in windows.items()
+            }
+            queries = [
+                self.__timeline_query(duration, start_date, end_date, by_month)
+                for duration, (start_date, _, by_month) in windows.items()
+            ]
+            query = queries[0] if len(queries) == 1 else union_all(*queries)
+            with self:
+                rows = self._db_session.execute(query).all()
+            for row in rows:
+                key_by_period = windows[row.duration][1]
+                key = key_by_period.get(date(row.year, row.month, row.day))
+                if key is not None:
+                    interview_counts[row.duration][key] = row.count
+
+            for duration, counts in interview_counts.items():
+                timelines[duration] = [
+                    {"interview_date": period, "completed_count": count}
+                    for period, count in sorted(counts.items())
+                ]
+                CacheHelper.set(
+                    CacheNamespace.REPORTING,
+                    _hourly_cache_key("timeline", duration),
+                    timelines[duration],
+                )
+        return {duration: timelines[duration] for duration in durations}
 
-    def get_completed_interviews_counts_by_month(self, duration: str) -> dict:
+    def get_completed_interviews_counts_by_days(self, duration: str) -> dict:
         """
         Fetches the completed interviews counts for the given duration.
 
@@ -69,47 +174,19 @@ class Reports(DBEnterExitMixin):
         Returns:
             dict: A dictionary containing the completed interviews counts.
         """
-        logger.info("Fetching completed interviews counts for %s...", duration)
-        months = int(duration.replace(" Months", ""))
+        return self.get_completed_interviews_timelines([duration])[duration]
 
-        end_date = datetime.now()
-        # Set start_date to the first day of the month 'months' ago
-        start_month = (end_date.month - months + 1) % 12 or 12
-        start_year = (
-            end_date.year if end_date.month - months + 1 > 0 else end_date.year - 1
-        )
-        start_date = datetime(start_year, start_month, 1)
+    def get_completed_interviews_counts_by_month(self, duration: str) -> dict:
+        """
+        Fetches the completed interviews counts for the given duration.
 
-        # Prepare month keys in abbreviated month name and 2-digit year format
-        month_keys = []
-        for i in range(months):
-            month = (start_date.month + i - 1) % 12 + 1
-            year = start_date.year + ((start_date.month + i - 1) // 12)
-            month_keys.append(
-                f"{datetime.strptime(str(month), '%m').strftime('%b')}-{year % 100:02d}"
-            )
-        interview_counts = {k: 0 for k in month_keys}
-
-        with self:
-            interviews = (
-                self._db_session.query(InterviewORM)
-                .filter(InterviewORM.status == InterviewStatus.COMPLETED.value)
-                .filter(InterviewORM.interview_datetime >= start_date)
-                .filter(InterviewORM.interview_datetime <= end_date)
-                .all()
-            )
-            for interview in interviews:
-                if interview.interview_datetime:
-                    month_key = interview.interview_datetime.strftime("%b-%y")
-                    if month_key in interview_counts:
-                        interview_counts[month_key] += 1
-            return [
-                {
-                    "interview_date": month,
-                    "completed_count": count,
-                }
-                for month, count in sorted(interview_counts.items())
-            ]
+        Args:
+            duration (str): The duration for which to fetch the completed interviews counts.
+
+        Returns:
+            dict: A dictionary containing the completed interviews counts.
+        """
+        return self.get_completed_interviews_timelines([duration])[duration]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""Shared fixtures: an in-memory database standing in for MariaDB."""
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import String, create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from commons import Base, CacheHelper, CacheNamespace, UserRole
+from user_management.models import UserORM
+from user_management.src.admin import Admin
+
+ADMIN_ID = 1
+
+
+@pytest.fixture
+def db_helper():
+    """
+    Stand-in for Database, exposing a session factory over in-memory SQLite.
+
+    Users.email is created with the NOCASE collation, so email lookups and the
+    unique index are case-insensitive like MariaDB's default collation.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    email = UserORM.__table__.c.email
+    email_type = email.type
+    email.type = String(255, collation="NOCASE")
+    try:
+        Base.metadata.create_all(
+            engine,
+            tables=[
+                Base.metadata.tables[name]
+                for name in ("Users", "Candidates", "Interviews")
+            ],
+        )
+    finally:
+        email.type = email_type
+    yield SimpleNamespace(session=sessionmaker(bind=engine, expire_on_commit=False))
+    engine.dispose()
+
+
+@pytest.fixture
+def admin(db_helper):
+    """An authorized Admin whose sessions use the test database."""
+    CacheHelper.set(CacheNamespace.AUTH, ADMIN_ID, (UserRole.ADMIN, True))
+    admin = Admin(ADMIN_ID)
+    admin._db_helper = db_helper  # pylint: disable=protected-access
+    yield admin
+    CacheHelper.pop(CacheNamespace.AUTH, ADMIN_ID)
@@ -0,0 +1,116 @@
+"""Tests for the Admin class."""
+
+import asyncio
+from io import BytesIO
+from smtplib import SMTPRecipientsRefused
+
+import pandas as pd
+import pytest
+from sqlalchemy import select
+
+import user_management.src.admin as admin_module
+from commons import InterviewStatus, UserRole
+from interview.src.models import InterviewORM
+from user_management.models import UserORM
+from user_management.models.candidate import CandidateORM
+
+
+def add_candidates(db_helper, count: int) -> list:
+    """Add candidates with one interview each and return their ids."""
+    with db_helper.session() as session:
+        candidates = [
+            CandidateORM(
+                role=UserRole.CANDIDATE,
+                name=f"Candidate {i}",
+                email=f"candidate{i}@example.com",
+                grade="G1",
+                location="Pune",
+                skill="PYTHON",
+                designation="ENGINEER",
+                department="IT",
+                interviews=[InterviewORM(status=InterviewStatus.NOT_SCHEDULED)],
+            )
+            for i in range(count)
+        ]
+        session.add_all(candidates)
+        session.commit()
+        return [candidate.id for candidate in candidates]
+
+
+async def read_body(response) -> bytes:
+    """Collect the body of a StreamingResponse."""
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.parametrize("count, pages", [(5, 3), (4, 2)])
+def test_get_all_candidates_follows_next_cursor(admin, db_helper, count, pages):
+    candidate_ids = add_candidates(db_helper, count)
+
+    seen_ids = []
+    after_id = None
+    for _ in range(pages):
+        page = admin.get_all_candidates(1, "ALL", results_per_page=2, after_id=after_id)
+        assert page["count"] == count
+        assert page["data"]
+        seen_ids.extend(candidate.id for candidate in page["data"])
+        after_id = page["next_cursor"]
+
+    # The last page hands back no cursor, even when it is full
+    assert after_id is None
+    assert seen_ids == candidate_ids
+
+
+def test_process_bulk_profiles_skips_case_variant_emails(
+    admin, db_helper, tmp_path, monkeypatch
+):
+    add_candidates(db_helper, 1)  # candidate0@example.com
+    monkeypatch.setattr(admin_module, "FILES_DIR", str(tmp_path))
+    profile = {
+        "GRADE": "G1",
+        "LOCATION": "Pune",
+        "SKILL": "python",
+        "DESIGNATION": "engineer",
+        "DEPARTMENT": "IT",
+    }
+    pd.DataFrame(
+        [
+            {"NAME": "Existing", "EMAIL": "Candidate0@example.com", **profile},
+            {"NAME": "New", "EMAIL": "new@example.com", **profile},
+            {"NAME": "Repeated", "EMAIL": "NEW@example.com", **profile},
+        ]
+    ).to_excel(tmp_path / "bulk_profiles.xlsx", index=False)
+
+    response = admin.process_bulk_profiles()
+
+    processed = pd.read_excel(BytesIO(asyncio.run(read_body(response))))
+    assert processed["STATUS"].tolist() == [
+        "User Exists. Skipped",
+        "Success",
+        "User Exists. Skipped",
+    ]
+    with db_helper.session() as session:
+        emails = session.scalars(select(UserORM.email).order_by(UserORM.id)).all()
+    assert emails == ["candidate0@example.com", "new@example.com"]
+
+
+def test_invite_candidates_skips_failed_emails(admin, db_helper, monkeypatch):
+    candidate_ids = add_candidates(db_helper, 3)
+    sent = []
+
+    class FakeEmailHelper:
+        """Refuses the second candidate's address, like SMTPRecipientsRefused."""
+
+        def __init__(self, email_address):
+            self.email_address = email_address
+
+        def send_candidate_invite(self, email_body, email_address=None):
+            if email_address == "candidate1@example.com":
+                raise SMTPRecipientsRefused({email_address: (550, b"Refused")})
+            sent.append(email_address)
+
+    monkeypatch.setattr(admin_module, "EmailHelper", FakeEmailHelper)
+
+    invited_ids = admin.invite_candidates(candidate_ids)
+
+    assert invited_ids == [candidate_ids[0], candidate_ids[2]]
+    assert sent == ["candidate0@example.com", "candidate2@example.com"]
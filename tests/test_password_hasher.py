@@ -0,0 +1,37 @@
+"""Tests for password hashing."""
+
+import pytest
+
+import user_management.src.password_hasher as password_hasher
+from user_management.src.password_hasher import hash_password, verify_password
+
+
+@pytest.fixture
+def padded_waits(monkeypatch):
+    """Count the padded failures instead of sleeping through them."""
+    waits = []
+    monkeypatch.setattr(
+        password_hasher, "wait_as_if_verifying", lambda: waits.append(True)
+    )
+    return waits
+
+
+@pytest.mark.parametrize(
+    "password_hash",
+    [
+        "abc$def$ghi",  # Werkzeug shape with an unknown method
+        "$2b$12$short",  # Truncated bcrypt hash
+        "$2b$12$" + "a" * 52 + "*",  # bcrypt length with an invalid character
+    ],
+)
+def test_verify_password_rejects_malformed_hash(password_hash, padded_waits):
+    assert verify_password(password_hash, "Secret#123") is False
+    assert padded_waits == [True]
+
+
+def test_verify_password_accepts_bcrypt_hash(padded_waits):
+    password_hash = hash_password("Secret#123")
+
+    assert verify_password(password_hash, "Secret#123") is True
+    assert verify_password(password_hash, "Wrong#123") is False
+    assert not padded_waits
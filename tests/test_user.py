@@ -0,0 +1,34 @@
+"""Tests for the User class."""
+
+from commons import UserRole
+from user_management.models import UserORM
+from user_management.src.password_hasher import hash_password
+from user_management.src.user import LoginResult, User
+
+PASSWORD = "Secret#123"
+
+
+def test_login_many_matches_emails_case_insensitively(db_helper):
+    with db_helper.session() as session:
+        session.add(
+            UserORM(
+                id=7,
+                role=UserRole.ADMIN,
+                name="Alice",
+                email="alice@example.com",
+                passwordhash=hash_password(PASSWORD),
+            )
+        )
+        session.commit()
+    alice = LoginResult(7, "Alice", UserRole.ADMIN)
+
+    results = User(db_helper=db_helper).login_many(
+        [
+            ("Alice@example.com", PASSWORD),
+            ("alice@example.com", "Wrong#123"),
+            ("bob@example.com", PASSWORD),
+        ]
+    )
+
+    assert results == [alice, None, None]
+    assert User(db_helper=db_helper).login("Alice@example.com", PASSWORD) == alice
@@ -6,7 +6,7 @@ It extends the UserORM class and includes additional attributes specific
 to candidates such as job ID, grade, location, technology, and department.
 """
 
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String
 from sqlalchemy.sql import text
 from sqlalchemy.orm import relationship
 
@@ -33,6 +33,17 @@ class CandidateORM(UserORM):
     """
 
     __tablename__ = "Candidates"
+    __table_args__ = (
+        Index(
+            "ix_candidates_search_ft",
+            "skill",
+            "designation",
+            "department",
+            "location",
+            "grade",
+            mariadb_prefix="FULLTEXT",
+        ),
+    )
     id = Column(Integer, ForeignKey("Users.id"), primary_key=True)
     grade = Column(String(255), nullable=False)
     location = Column(String(255), nullable=False)
@@ -1,9 +1,9 @@
 """ ORM class for managing users. """
 
 from sqlalchemy.sql import text
-from sqlalchemy import Column, Integer, String, Enum, Boolean
+from sqlalchemy import Column, Integer, String, Enum, Boolean, Index
 
-from commons import Base
+from commons import Base, UserRole
 
 
 class UserORM(Base):
@@ -11,8 +11,15 @@ class UserORM(Base):
 
     # Below tells SQLAlchemy name of the table to which this class should be mapped.
     __tablename__ = "Users"  # Case sensitive in *nix
+    # Backs the MATCH ... AGAINST search on name and email.
+    __table_args__ = (
+        Index("ix_users_name_email_ft", "name", "email", mariadb_prefix="FULLTEXT"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    role = Column(Enum("Candidate", "Admin"), nullable=False)
+    role = Column(
+        Enum(UserRole, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+    )
     name = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
     passwordhash = Column(String(255), nullable=True)
@@ -27,6 +34,6 @@ class UserORM(Base):
             "id": self.id,
             "name": self.name,
             "email": self.email,
-            "role": self.role,
+            "role": self.role.value if self.role else None,
             "is_active": self.is_active,
         }
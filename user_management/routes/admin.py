@@ -19,7 +19,7 @@ router = APIRouter(tags=["admin"])
 
 @router.get(
     "/candidates",
-    response_model=Dict[str, Union[List[CandidateResponseInfo], int]],
+    response_model=Dict[str, Union[List[CandidateResponseInfo], int, None]],
     status_code=status.HTTP_200_OK,
 )
 def get_all_candidates(
@@ -33,6 +33,9 @@ def get_all_candidates(
     interview_status: Optional[str] = Query(
         "ALL", description="Status of the interview to filter candidates"
     ),
+    after_id: Optional[int] = Query(
+        None, description="Next cursor of the previous page; overrides page_num"
+    ),
 ):
     """
     Retrieve a paginated list of candidate profiles for an admin user.
@@ -47,10 +50,12 @@ def get_all_candidates(
       defaulting to 1.
     - results_per_page (int, optional): Number of profiles per page, defaulting to 10.
     - interview_status (str, optional): Status of the interview to filter candidates, defaulting to 'ALL'.
+    - after_id (int, optional): The next_cursor of the previous page. Seeking past it is cheaper than
+      page_num for deep pages.
 
     Returns:
-    - Dict[str, Union[List[CandidateResponseInfo], int]]: A dictionary containing the list of candidate profiles for
-    the specified page and the total count of candidates.
+    - Dict[str, Union[List[CandidateResponseInfo], int, None]]: A dictionary containing the list of candidate
+    profiles for the specified page, the total count of candidates and the next_cursor.
 
     Raises:
     - HTTPException: If the user is unauthorized to access candidate profiles.
@@ -58,7 +63,7 @@ def get_all_candidates(
 
     try:
         return Admin(user_id).get_all_candidates(
-            page_num, interview_status, results_per_page
+            page_num, interview_status, results_per_page, after_id
         )
     except PermissionError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e)) from e
@@ -3,9 +3,10 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
-from commons import AuthenticationException, AuthorizationException, logger
+from commons import AuthenticationException, AuthorizationException, UserRole, logger
 from user_management.routes.lib import (
     add_token_to_revocation_list,
     generate_jwt_token,
@@ -26,23 +27,23 @@ def login(
     """Login a user and return an access token."""
     logger.info("User login request received")
     try:
-        user_id, name, role = User().login(login_info.username, login_info.password)
-        if role == "Candidate":
-            if Candidate(user_id).credentials_expired():
+        user = User().login(login_info.username, login_info.password)
+        if user.role is UserRole.CANDIDATE:
+            if Candidate(user.id).credentials_expired():
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Credentials expired !",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
-        access_token = generate_jwt_token(user_id, "access")
-        refresh_token = generate_jwt_token(user_id, "refresh")
+        access_token = generate_jwt_token(user.id, "access")
+        refresh_token = generate_jwt_token(user.id, "refresh")
 
         return {
-            "user_id": user_id,
-            "name": name,
+            "user_id": user.id,
+            "name": user.name,
             "access_token": access_token,
             "refresh_token": refresh_token,
-            "role": role,
+            "role": user.role.value,
             # "token_type": "Bearer",
         }
     except (AuthorizationException, AuthenticationException) as e:
@@ -80,11 +81,8 @@ def logout(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Access token and refresh token are required.",
         )
-    # Invalidate the access token
-    add_token_to_revocation_list(access_token)
-
-    # Invalidate the refresh token
-    add_token_to_revocation_list(refresh_token)
+    # Invalidate the access and refresh tokens together
+    add_token_to_revocation_list(access_token, refresh_token)
 
 
 @router.get("/refresh")
@@ -115,7 +113,8 @@ async def change_password(
     """
     try:
         user_obj = User(user_id=user_id)
-        user_obj.set_password(request)
+        # Hashing and the DB round trips block, keep them off the event loop
+        await run_in_threadpool(user_obj.set_password, request)
         return {"detail": "Password changed successfully"}
     except ValueError as exc:
         raise HTTPException(
@@ -1,24 +1,44 @@
 """ Helper functions for the user service. """
 
+import base64
+import binascii
+import hashlib
 import os
+import threading
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
+import jwt
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jwt import InvalidTokenError as JWTError
+from redis import RedisError
 
-from commons import logger
+from commons import logger, redis_client
+from user_management.src.admin import Admin
 
 load_dotenv(override=True)
 SECRET_KEY = os.environ.get("SECRET_KEY")
 ALGORITHM = os.environ.get("ALGORITHM")
+# Encoded once so jwt.encode/decode don't re-encode the key on every call.
+_SIGNING_KEY = SECRET_KEY.encode() if SECRET_KEY else None
+_ALGORITHMS = (ALGORITHM,)
+REVOKED_TOKEN_PREFIX = "jwt:revoked:"
 # >>> import secrets
 # >>> secrets.token_hex()
 # SECRET_KEY = "c675e7ca94f91314b650ff37c9d9fd743ad2d256de69fe2a8a603ed3478e6d47"
 # ALGORITHM = "HS256"
 
+_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
+
+# Verified token payloads, so a token is only HMAC-checked once a minute.
+_decoded_tokens = TTLCache(maxsize=10_000, ttl=60)
+_decoded_tokens_lock = threading.RLock()
+
 
 def generate_jwt_token(user_id: int, token_usage="access"):
     """Create an access or refresh token for the user."""
@@ -34,27 +54,117 @@ def generate_jwt_token(user_id: int, token_usage="access"):
         "exp": datetime.now(timezone.utc) + expires_delta,
         "token_usage": token_usage,
     }
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def add_token_to_revocation_list(token: str):
-    """This function should add the token to some persistent store.
-    Implement the logic according to our storage solution."""
+def _revocation_key(token: str) -> str:
+    """Redis key for a revoked token; hashed to keep key length bounded."""
+    return REVOKED_TOKEN_PREFIX + hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Fixed-size cache key for a token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _precheck_token(token: str, token_usage: str):
+    """Reject malformed, expired or wrong-usage tokens before the HMAC check.
+
+    The payload is read unverified here; it is only trusted after jwt.decode.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise JWTError("Not enough segments")
+    try:
+        payload_segment = parts[1] + "=" * (-len(parts[1]) % 4)
+        claims = orjson.loads(base64.urlsafe_b64decode(payload_segment))
+    except (binascii.Error, ValueError) as e:
+        raise JWTError("Invalid payload segment") from e
+    if not isinstance(claims, dict):
+        raise JWTError("Invalid payload segment")
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)) or exp <= time.time():
+        raise JWTError("Signature has expired.")
+    if claims.get("token_usage") != token_usage:
+        raise JWTError(f"Invalid Token usage. {token_usage} token expected")
+
+
+def _decode_token(token: str, token_usage: str) -> dict:
+    """Decode and verify the token, reusing recently verified payloads."""
+    key = _token_cache_key(token)
+    with _decoded_tokens_lock:
+        payload = _decoded_tokens.get(key)
+    if payload is None:
+        _precheck_token(token, token_usage)
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
+        with _decoded_tokens_lock:
+            _decoded_tokens[key] = payload
+    elif payload["exp"] <= time.time():
+        raise JWTError("Signature has expired.")
+    return payload
+
+
+def add_token_to_revocation_list(*tokens: str):
+    """Revoke the tokens until they would have expired anyway.
 
+    All revocations are sent to Redis in one pipelined round trip. Raises a
+    503 if Redis can't be reached.
+    """
+    with redis_client.pipeline(transaction=False) as pipe:
+        for token in tokens:
+            with _decoded_tokens_lock:
+                _decoded_tokens.pop(_token_cache_key(token), None)
+            try:
+                payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
+            except JWTError as e:
+                # Expired or invalid tokens are already unusable.
+                logger.info("Skipping revocation of unusable token: %s", e)
+                continue
+            ttl = int(payload["exp"] - time.time())
+            if ttl > 0:
+                pipe.setex(_revocation_key(token), ttl, 1)
+                logger.info("Token revoked for %s seconds", ttl)
+        try:
+            pipe.execute()
+        except RedisError as e:
+            raise _revocation_list_unavailable(e) from e
 
-def get_current_refresh_user(
-    token: Annotated[str, Depends(OAuth2PasswordBearer(tokenUrl="/login"))]
-):
+
+def _revocation_list_unavailable(error: RedisError) -> HTTPException:
+    """The 503 raised when the revocation list in Redis can't be reached."""
+    logger.error("Token revocation list unavailable: %s", error)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is temporarily unavailable",
+    )
+
+
+def _check_not_revoked(token: str):
+    """Raise a JWTError if the token has been revoked.
+
+    Fails closed: if Redis can't be reached a 503 is raised, as a revoked
+    token couldn't be told apart from a valid one.
+    """
+    try:
+        revoked = redis_client.exists(_revocation_key(token))
+    except RedisError as e:
+        raise _revocation_list_unavailable(e) from e
+    if revoked:
+        raise JWTError("Token has been revoked")
+
+
+def get_current_refresh_user(token: Annotated[str, Depends(_oauth2_scheme)]):
     """Get the current user from the refresh token."""
     try:
         logger.info("Decoding refresh token..")
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token, "refresh")
         user_id: int = int(payload.get("sub"))
         if user_id is None:
             raise JWTError("User ID is None in payload")
         if payload.get("token_usage") != "refresh":
             raise JWTError("Invalid Token usage. Refresh token expected")
+        _check_not_revoked(token)
         return {"user_id": user_id}
     except JWTError as e:
         logger.exception(e)
@@ -65,18 +175,17 @@ def get_current_refresh_user(
         ) from e
 
 
-def get_current_user(
-    token: Annotated[str, Depends(OAuth2PasswordBearer(tokenUrl="/login"))]
-):
+def get_current_user(token: Annotated[str, Depends(_oauth2_scheme)]):
     """Get the current user from the token."""
     try:
         logger.info("Decoding access token..")
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = _decode_token(token, "access")
         user_id: int = int(payload.get("sub"))
         if user_id is None:
             raise JWTError("User ID is None in payload")
         if payload.get("token_usage") != "access":
             raise JWTError("Invalid Token usage. access token expected")
+        _check_not_revoked(token)
         return user_id
     except JWTError as e:
         logger.exception(e)
@@ -85,3 +194,17 @@ def get_current_user(
             detail="Could not validate user",
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
+
+
+def get_authorized_admin(user_id: Annotated[int, Depends(get_current_user)]) -> Admin:
+    """Get the current user as an authorized admin.
+
+    Raises a 403 if the user is not an active admin, so endpoints depending on
+    this receive a ready-to-use Admin instance.
+    """
+    admin = Admin(user_id)
+    if not admin.is_authorized():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Unauthorized"
+        )
+    return admin
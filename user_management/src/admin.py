@@ -1,37 +1,93 @@
 """Admin class for the user service."""
 
+import numbers
 import os
+import re
 import secrets
 import string
 from datetime import datetime
-from io import BytesIO
-from typing import Dict, List, Union
+from tempfile import SpooledTemporaryFile
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
 
 import pandas as pd
-import pytz
+import xlsxwriter
 from dotenv import load_dotenv
 from fastapi.responses import StreamingResponse
 from jinja2 import Template
-from sqlalchemy import and_, case, func, or_
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
-from werkzeug.security import generate_password_hash
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import distinct, func, or_, select, update
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import load_only, selectinload
 
 from commons import (
+    CacheHelper,
+    CacheNamespace,
     EmailHelper,
     InterviewStatus,
     RecordNotFoundException,
-    UserExistsException,
+    UserRole,
     logger,
 )
 from interview.src.models import InterviewORM
 from user_management.models.candidate import CandidateORM
 from user_management.models.user import UserORM
+from user_management.src.password_hasher import hash_password
 from user_management.src.schemas import CandidateInfo, CandidateResponseInfo
 from user_management.src.user import User
 
 load_dotenv(override=True)
 FILES_DIR = os.environ.get("FILES_DIR")
+EXPORT_YIELD_PER = 1000  # Candidates fetched from the DB per chunk
+EXPORT_SPOOL_SIZE = 16 * 1024 * 1024  # Spill the export to disk beyond this
+EXPORT_STREAM_CHUNK_SIZE = 64 * 1024
+BULK_PROFILE_COLUMNS = (
+    "NAME",
+    "GRADE",
+    "LOCATION",
+    "SKILL",
+    "DESIGNATION",
+    "DEPARTMENT",
+    "EMAIL",
+)
+FULLTEXT_MIN_TOKEN_SIZE = 3  # InnoDB innodb_ft_min_token_size default
+DASHBOARD_CACHE_TTL_SECONDS = 10
+# Uppercased in bulk before validation, like CandidateInfo does per row
+BULK_PROFILE_UPPERCASE_COLUMNS = ("SKILL", "DESIGNATION")
+CANDIDATE_LIST_ADAPTER = TypeAdapter(List[CandidateInfo])
+CANDIDATE_RESPONSE_LIST_ADAPTER = TypeAdapter(List[CandidateResponseInfo])
+IST = ZoneInfo("Asia/Kolkata")
+PASSWORD_ALPHABET = string.ascii_letters + string.digits + string.punctuation
+# Largest multiple of the alphabet size that fits in a byte, bytes at or above
+# it are discarded so every character stays equally likely
+PASSWORD_BYTE_LIMIT = 256 - 256 % len(PASSWORD_ALPHABET)
+CacheHelper.get_cache(CacheNamespace.DASHBOARD, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+
+# Compiled once so invites only render
+with open(
+    os.path.join("user_management", "src", "candidate_invite.html"),
+    "r",
+    encoding="utf-8",
+) as f:
+    INVITE_TEMPLATE = Template(f.read())
+
+
+def _excel_cell(value):
+    """Cells hold scalars only; other values are written as their string form."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, numbers.Number):
+        return None if pd.isna(value) else value  # Blank cell for NaN
+    return str(value)
+
+
+def _iter_file(fp) -> Iterator[bytes]:
+    """Yield the file in chunks, closing it once exhausted."""
+    try:
+        while chunk := fp.read(EXPORT_STREAM_CHUNK_SIZE):
+            yield chunk
+    finally:
+        fp.close()
 
 
 class Admin(User):
@@ -40,8 +96,6 @@ class Admin(User):
     def __init__(self, user_id):
         super().__init__(user_id)
         self.__authorized = False
-        if user_id:
-            self._set_user_record_by_id()
 
     def __enter__(self):
         super().__enter__()
@@ -61,126 +115,222 @@ class Admin(User):
         """
         logger.info("Checking if user is authorized...")
         if not self.__authorized:
-            if self._db_session is None:
-                super().__enter__()
-            user = (
-                self._db_session.query(UserORM).filter(UserORM.id == self._id).first()
-            )
-            if user and user.role == "Admin" and user.is_active:
-                self.__authorized = True
-            else:
-                self.__authorized = False
+            self.__authorized = self.__is_active_admin(self._id)
         return self.__authorized
 
+    @staticmethod
+    def __is_active_admin(user_id: int) -> bool:
+        """
+        Look up whether the user is an active admin.
+
+        The user's (role, is_active) is cached for a few seconds (see
+        AUTH_CACHE_TTL_SECONDS in user.py) so admin endpoints don't query the
+        user on every call.
+        """
+        role_and_status = CacheHelper.get(CacheNamespace.AUTH, user_id)
+        if role_and_status is None:
+            user = User(user_id)
+            try:
+                user._set_user_record_by_id()  # pylint: disable=protected-access
+            except (RecordNotFoundException, ValueError):
+                return False
+            role_and_status = (
+                user.user_profile.role,
+                bool(user.user_profile.is_active),
+            )
+            CacheHelper.set(CacheNamespace.AUTH, user_id, role_and_status)
+        role, is_active = role_and_status
+        return role is UserRole.ADMIN and is_active
+
+    @staticmethod
+    def __latest_interview_status():
+        """
+        Correlated subquery for the status of a candidate's latest interview.
+
+        Served by the (candidate_id, interview_datetime) index as one short
+        index lookup per candidate, instead of ranking every interview with a
+        window function. MariaDB has no LATERAL joins, hence the scalar form.
+        """
+        return (
+            select(InterviewORM.status)
+            .where(InterviewORM.candidate_id == CandidateORM.__table__.c.id)
+            .order_by(
+                InterviewORM.interview_datetime.is_(None).desc(),  # NULLs first
+                InterviewORM.interview_datetime.desc(),  # Among non-NULLs, latest first
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+
     def __fetch_all_candidates_with_latest_status(self, interview_status: str = "ALL"):
+        """Build the candidates query; must be run inside the session context."""
         logger.info("Fetching all candidates..")
-        with self:
-            # Subquery for latest interviews
-            latest_interviews = self._db_session.query(
-                InterviewORM.candidate_id,
-                InterviewORM.status,
-                InterviewORM.interview_datetime,
-                func.row_number()
-                .over(
-                    partition_by=InterviewORM.candidate_id,
-                    order_by=[
-                        InterviewORM.interview_datetime.is_(None).desc(),  # NULLs first
-                        InterviewORM.interview_datetime.desc(),  # Among non-NULLs, latest first
-                    ],
-                )
-                .label("rn"),
-            ).subquery("latest_interviews")
-
-            # Build base query with join
-            query = self._db_session.query(
-                CandidateORM,
-                latest_interviews.c.status.label("latest_interview_status"),
-            ).join(
-                latest_interviews,
-                and_(
-                    CandidateORM.id == latest_interviews.c.candidate_id,
-                    latest_interviews.c.rn == 1,  # Only get the top row per candidate
-                ),
+        latest_status = self.__latest_interview_status()
+        query = self._db_session.query(
+            CandidateORM,
+            latest_status.label("latest_interview_status"),
+        )
+        if interview_status != "ALL":
+            query = query.filter(latest_status == interview_status)
+        else:
+            # Only candidates with at least one interview are listed
+            query = query.filter(
+                select(InterviewORM.id)
+                .where(InterviewORM.candidate_id == CandidateORM.id)
+                .exists()
             )
-            if interview_status != "ALL":
-                query = query.filter(latest_interviews.c.status == interview_status)
-            return query
+        return query
+
+    @staticmethod
+    def __count_candidates_stmt(interview_status: str = "ALL"):
+        """
+        Build a count of the candidates listed for the given status.
+
+        Only candidates with at least one interview are listed, so for ALL this
+        counts distinct candidate ids on Interviews. For a specific status it
+        compares each candidate's latest interview status, without the window
+        function and columns of the page query.
+        """
+        if interview_status == "ALL":
+            # pylint: disable=E1102
+            return select(func.count(distinct(InterviewORM.candidate_id)))
+        candidates = CandidateORM.__table__
+        latest_status = Admin.__latest_interview_status()
+        # pylint: disable=E1102
+        return (
+            select(func.count())
+            .select_from(candidates)
+            .where(latest_status == interview_status)
+        )
+
+    @staticmethod
+    def __to_response_info(rows) -> List[CandidateResponseInfo]:
+        """
+        Validate (candidate, latest interview status) rows as response models.
+
+        The whole list goes through a single TypeAdapter call instead of one
+        CandidateResponseInfo construction per row.
+        """
+        return CANDIDATE_RESPONSE_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "id": candidate.id,
+                    "name": candidate.name,
+                    "email": candidate.email,
+                    "grade": candidate.grade,
+                    "location": candidate.location,
+                    "skill": candidate.skill,
+                    "designation": candidate.designation,
+                    "department": candidate.department,
+                    "interview_status": (
+                        interview_status.value if interview_status else None
+                    ),
+                    "resume": candidate.resume,
+                }
+                for candidate, interview_status in rows
+            ]
+        )
 
     def get_all_candidates(
-        self, page_number, interview_status: str, results_per_page=10
-    ) -> Dict[str, Union[List[CandidateResponseInfo], int]]:
+        self,
+        page_number,
+        interview_status: str,
+        results_per_page=10,
+        after_id: Optional[int] = None,
+    ) -> Dict[str, Union[List[CandidateResponseInfo], int, None]]:
         """
         Retrieve a paginated list of candidate profiles.
 
+        Pages are ordered by candidate id. When after_id is given the page starts
+        right after that id, which is an index seek, instead of skipping
+        (page_number - 1) pages with OFFSET, which gets slower for deep pages.
+
         Parameters:
         - page_number (int): The current page number to retrieve.
         - interview_status (str): Status of the interview to filter candidates.
         - results_per_page (int, optional): Number of profiles per page, defaulting to 10.
+        - after_id (int, optional): The id of the last candidate of the previous page.
 
         Returns:
-        - Dict[str, Union[List[CandidateResponseInfo], int]]:
-            A dictionary containing the list of candidate profiles for the specified page and the total count of
-            candidates.
+        - Dict[str, Union[List[CandidateResponseInfo], int, None]]:
+            A dictionary containing the list of candidate profiles for the specified page, the total count of
+            candidates and the next_cursor to pass as after_id for the next page (None on the last page).
         """
         if interview_status != "ALL" and interview_status not in [
             status.value for status in InterviewStatus
         ]:
             raise ValueError("Invalid interview status")
 
-        query = self.__fetch_all_candidates_with_latest_status(interview_status)
-
-        # Get count and paginated results
-        count = query.count()
-        paginated_candidates = (
-            query.limit(results_per_page)
-            .offset((page_number - 1) * results_per_page)
-            .all()
-        )
-
-        response_data = [
-            CandidateResponseInfo(
-                id=candidate.id,
-                name=candidate.name,
-                email=candidate.email,
-                grade=candidate.grade,
-                location=candidate.location,
-                skill=candidate.skill,
-                designation=candidate.designation,
-                department=candidate.department,
-                interview_status=(interview_status.value if interview_status else None),
-                resume=candidate.resume,
-            )
-            for candidate, interview_status in paginated_candidates
-        ]
-        return {"data": response_data, "count": count}
+        with self:
+            query = self.__fetch_all_candidates_with_latest_status(interview_status)
+
+            count = self._db_session.execute(
+                self.__count_candidates_stmt(interview_status)
+            ).scalar()
+            if after_id is not None:
+                query = query.filter(CandidateORM.id > after_id)
+            # Fetch a deterministically ordered page, plus one row to tell
+            # whether another page follows.
+            query = query.order_by(CandidateORM.id).limit(results_per_page + 1)
+            if after_id is None:
+                query = query.offset((page_number - 1) * results_per_page)
+            paginated_candidates = query.all()
+
+        has_next_page = len(paginated_candidates) > results_per_page
+        response_data = self.__to_response_info(paginated_candidates[:results_per_page])
+        next_cursor = response_data[-1].id if has_next_page else None
+        return {"data": response_data, "count": count, "next_cursor": next_cursor}
 
     def export_candidates_to_excel(self) -> StreamingResponse:
         """
         Fetch all candidates and export as an Excel file.
         """
+        output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+        # constant_memory flushes each row as it is written
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        sheet = workbook.add_worksheet("Candidates")
+        row_num = 0
         with self:
-            candidates = (
-                self._db_session.query(CandidateORM)
-                .options(joinedload(CandidateORM.interviews))
-                .all()
-            )
+            candidates = self._db_session.execute(
+                select(CandidateORM)
+                .options(
+                    # Only the columns CandidateORM.to_dict exports
+                    load_only(
+                        CandidateORM.name,
+                        CandidateORM.email,
+                        CandidateORM.role,
+                        CandidateORM.is_active,
+                        CandidateORM.skill,
+                        CandidateORM.designation,
+                        CandidateORM.resume,
+                    ),
+                    # One batched IN query per chunk for the interviews.
+                    selectinload(CandidateORM.interviews).load_only(
+                        InterviewORM.status,
+                        InterviewORM.email_datetime,
+                        InterviewORM.interview_datetime,
+                    ),
+                )
+                .execution_options(yield_per=EXPORT_YIELD_PER)
+            ).scalars()
+            for candidate in candidates:
+                candidate_dict = candidate.to_dict()
+                if row_num == 0:
+                    sheet.write_row(row_num, 0, list(candidate_dict))
+                    row_num += 1
+                sheet.write_row(
+                    row_num, 0, [_excel_cell(v) for v in candidate_dict.values()]
+                )
+                row_num += 1
 
-        if not candidates:
+        workbook.close()
+        if row_num == 0:
+            output.close()
             raise RecordNotFoundException("No candidates found")
-
-        # Convert ORM objects to dicts
-        candidate_dicts = [c.to_dict() for c in candidates]
-        for candidate in candidate_dicts:
-            candidate.pop("_sa_instance_state", None)  # Remove SQLAlchemy metadata
-
-        # Convert to DataFrame and write to Excel
-        df = pd.DataFrame(candidate_dicts)
-        output = BytesIO()
-        df.to_excel(output, index=False, sheet_name="Candidates")
         output.seek(0)
 
         return StreamingResponse(
-            output,
+            _iter_file(output),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={"Content-Disposition": "attachment; filename=candidates.xlsx"},
         )
@@ -193,48 +343,38 @@ class Admin(User):
         them as a dictionary with the following keys: total_applications, scheduled_interviews,
         inprogress_interviews, and completed_interviews.
 
+        The counters are the same for every admin, so they are computed at most
+        once per DASHBOARD_CACHE_TTL_SECONDS.
+
         Returns:
             dict: A dictionary containing the admin dashboard statistics.
         """
         logger.info("Getting admin dashboard..")
+        dashboard = CacheHelper.get(CacheNamespace.DASHBOARD, "dashboard")
+        if dashboard is not None:
+            return dashboard
         with self:
-            result = self._db_session.query(
-                # pylint: disable=E1102
-                func.count(InterviewORM.candidate_id).label("total_applications"),
-                func.sum(
-                    case(
-                        (
-                            InterviewORM.status == InterviewStatus.SCHEDULED.value,
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("scheduled_interviews"),
-                func.sum(
-                    case(
-                        (
-                            InterviewORM.status == InterviewStatus.IN_PROGRESS.value,
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("inprogress_interviews"),
-                func.sum(
-                    case(
-                        (
-                            InterviewORM.status == InterviewStatus.COMPLETED.value,
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("completed_interviews"),
-            ).one()
-            return {
-                "total_applicants": result.total_applications,
-                "scheduled_interviews": result.scheduled_interviews,
-                "inprogress_interviews": result.inprogress_interviews,
-                "completed_interviews": result.completed_interviews,
-            }
+            # One row per status, read off the leading column of
+            # ix_interview_status_dt instead of CASE-summing every row.
+            rows = (
+                self._db_session.query(
+                    InterviewORM.status,
+                    func.count().label("count"),  # pylint: disable=E1102
+                )
+                .group_by(InterviewORM.status)
+                .all()
+            )
+        count_by_status = {status: count for status, count in rows}
+        dashboard = {
+            "total_applicants": sum(count_by_status.values()),
+            "scheduled_interviews": count_by_status.get(InterviewStatus.SCHEDULED, 0),
+            "inprogress_interviews": count_by_status.get(
+                InterviewStatus.IN_PROGRESS, 0
+            ),
+            "completed_interviews": count_by_status.get(InterviewStatus.COMPLETED, 0),
+        }
+        CacheHelper.set(CacheNamespace.DASHBOARD, "dashboard", dashboard)
+        return dashboard
 
     def process_bulk_profiles(self) -> StreamingResponse:
         """
@@ -262,48 +402,127 @@ class Admin(User):
         errored_records = 0
         existing_candidates_skipped_count = 0
         new_candidates_added_count = 0
-        for idx, row in df.iterrows():
-            try:
-                candidate_info = CandidateInfo(
-                    name=row["NAME"],
-                    grade=row["GRADE"],
-                    location=row["LOCATION"],
-                    skill=row["SKILL"],
-                    designation=row["DESIGNATION"],
-                    department=row["DEPARTMENT"],
-                    email=row["EMAIL"],
-                )
-            except KeyError as e:
-                logger.error("Missing column in spreadsheet: %s", e)
-                logger.error("Row: %s", row)
-                errored_records += 1
-                df.at[idx, "STATUS"] = f"Missing column: {e}"
-                continue
-            try:
-                self.__create_candidate(candidate_info)
-                new_candidates_added_count += 1
-                df.at[idx, "STATUS"] = "Success"
-            except UserExistsException as e:
-                logger.error("%s. No action will be taken", e)
-                existing_candidates_skipped_count += 1
-                df.at[idx, "STATUS"] = "User Exists. Skipped"
+
+        missing_columns = [
+            column for column in BULK_PROFILE_COLUMNS if column not in df.columns
+        ]
+        if missing_columns:
+            logger.error("Missing column in spreadsheet: %s", missing_columns[0])
+            errored_records = len(df)
+            df["STATUS"] = f"Missing column: '{missing_columns[0]}'"
+        else:
+            sheet = df[list(BULK_PROFILE_COLUMNS)].copy()
+            for column in BULK_PROFILE_UPPERCASE_COLUMNS:
+                if sheet[column].dtype == object:
+                    # .str gives NaN for non-string cells, which keep their value
+                    sheet[column] = (
+                        sheet[column].str.strip().str.upper().fillna(sheet[column])
+                    )
+            candidates, errors = self.__validate_bulk_rows(
+                sheet.rename(columns=str.lower).to_dict("records")
+            )
+            # Map list positions back to the DataFrame's index
+            candidates = {df.index[pos]: info for pos, info in candidates.items()}
+            for pos, error in errors.items():
+                logger.error("Invalid record at row %s: %s", pos + 2, error)
+                df.at[df.index[pos], "STATUS"] = error
+            errored_records = len(errors)
+
+            with self:
+                # One lookup for every email in the sheet. Emails are compared
+                # casefolded, as the case-insensitive collation does.
+                existing_emails = {
+                    email.casefold()
+                    for (email,) in self._db_session.query(UserORM.email).filter(
+                        UserORM.email.in_([c.email for c in candidates.values()])
+                    )
+                }
+                new_rows = []
+                for idx, candidate_info in candidates.items():
+                    email = candidate_info.email.casefold()
+                    if email in existing_emails:
+                        logger.error(
+                            "User %s exists. No action will be taken",
+                            candidate_info.email,
+                        )
+                        existing_candidates_skipped_count += 1
+                        df.at[idx, "STATUS"] = "User Exists. Skipped"
+                        continue
+                    # Repeated emails within the sheet are skipped as well
+                    existing_emails.add(email)
+                    new_rows.append(
+                        {"role": UserRole.CANDIDATE, **candidate_info.model_dump()}
+                    )
+                    df.at[idx, "STATUS"] = "Success"
+
+                if new_rows:
+                    # return_defaults populates the generated ids in new_rows
+                    self._db_session.bulk_insert_mappings(
+                        CandidateORM, new_rows, return_defaults=True
+                    )
+                    self._db_session.bulk_insert_mappings(
+                        InterviewORM,
+                        [
+                            {
+                                "candidate_id": row["id"],
+                                "status": InterviewStatus.NOT_SCHEDULED,
+                            }
+                            for row in new_rows
+                        ],
+                    )
+                    self._db_session.commit()
+                    CacheHelper.clear(CacheNamespace.REPORTING)
+                    CacheHelper.clear(CacheNamespace.DASHBOARD)
+                new_candidates_added_count = len(new_rows)
 
         logger.info("Processed %s records", new_candidates_added_count)
         logger.info("Skipped %s records", existing_candidates_skipped_count)
         logger.info("Errored %s records", errored_records)
 
-        # Save the DataFrame to a BytesIO buffer
-        output = BytesIO()
-        df.to_excel(output, index=False)
+        # Spool the processed sheet, spilling to disk for large uploads. An
+        # XLSX is a zip finalized on close, so it is streamed once complete.
+        output = SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE)
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, list(df.columns))
+        for row_num, row in enumerate(df.itertuples(index=False), start=1):
+            sheet.write_row(row_num, 0, [_excel_cell(v) for v in row])
+        workbook.close()
         output.seek(0)
         return StreamingResponse(
-            output,
+            _iter_file(output),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers={
                 "Content-Disposition": "attachment; filename=bulk_profiles_processed.xlsx"
             },
         )
 
+    @staticmethod
+    def __validate_bulk_rows(
+        rows: List[dict],
+    ) -> Tuple[Dict[int, CandidateInfo], Dict[int, str]]:
+        """
+        Validate the spreadsheet rows with a single pass over the whole list.
+
+        Returns:
+            tuple: The valid candidates and the error message of the invalid rows,
+            both keyed by row position.
+        """
+        try:
+            return dict(enumerate(CANDIDATE_LIST_ADAPTER.validate_python(rows))), {}
+        except ValidationError as e:
+            errors = {}
+            for error in e.errors():
+                position, *field = error["loc"]
+                errors.setdefault(
+                    position, f"Invalid {'.'.join(map(str, field))}: {error['msg']}"
+                )
+        valid_positions = [pos for pos in range(len(rows)) if pos not in errors]
+        candidates = CANDIDATE_LIST_ADAPTER.validate_python(
+            [rows[pos] for pos in valid_positions]
+        )
+        return dict(zip(valid_positions, candidates)), errors
+
     def invite_candidate(self, candidate_id: int) -> bool:
         """
         Send a candidate invite to the specified candidate ID.
@@ -319,109 +538,114 @@ class Admin(User):
         Returns:
             bool: True if the email was sent successfully, False otherwise.
         """
-        logger.info("Sending invite to candidate ID: %s", candidate_id)
-        with self:
-            # Retrieve the candidate record from the database
-            candidate: CandidateORM = (
-                self._db_session.query(CandidateORM)
-                .filter(CandidateORM.id == candidate_id)
-                .first()
+        if not self.invite_candidates([candidate_id]):
+            raise RecordNotFoundException(
+                candidate_id, message=f"Candidate {candidate_id} not found"
             )
-            if not candidate:
-                raise RecordNotFoundException(
-                    candidate_id, message=f"Candidate {candidate_id} not found"
-                )
+        return True
 
-            # Generate a temporary password and update in the database
-            current_password: str = self.generate_password()
-            candidate.passwordhash = generate_password_hash(current_password)
-            candidate.is_active = True
+    def invite_candidates(self, candidate_ids: List[int]) -> List[int]:
+        """
+        Send candidate invites to the specified candidate IDs.
 
-            scheduled_datetime = datetime.now(pytz.utc).astimezone(
-                pytz.timezone("Asia/Kolkata")
-            )
-            # Check existing interviews for this candidate
-            existing_interviews = (
-                self._db_session.query(InterviewORM)
-                .filter(InterviewORM.candidate_id == candidate_id)
+        All database changes are made in one transaction and the emails are
+        sent over a single SMTP session. An invite that can't be sent is logged
+        and left out of the result, and the remaining invites are still sent.
+
+        Args:
+            candidate_ids (List[int]): The IDs of the candidates to invite.
+
+        Returns:
+            List[int]: The IDs of the candidates that were found and emailed.
+        """
+        logger.info("Sending invites to candidate IDs: %s", candidate_ids)
+        with self:
+            # Retrieve the candidate records from the database
+            candidates: List[CandidateORM] = (
+                self._db_session.query(CandidateORM)
+                .filter(CandidateORM.id.in_(candidate_ids))
                 .all()
             )
-
-            # Check for existing interviews with specific statuses
-            active_interview = next(
-                (
-                    i
-                    for i in existing_interviews
-                    if i.status
-                    in [
+            if not candidates:
+                return []
+            invited_ids = [candidate.id for candidate in candidates]
+
+            # Generate temporary passwords and update them in the database
+            passwords: Dict[int, str] = {}
+            for candidate in candidates:
+                passwords[candidate.id] = self.generate_password()
+                candidate.passwordhash = hash_password(passwords[candidate.id])
+                candidate.is_active = True
+
+            scheduled_datetime = datetime.now(IST)
+            active_interviews = (
+                InterviewORM.candidate_id.in_(invited_ids),
+                InterviewORM.status.in_(
+                    [
                         InterviewStatus.SCHEDULED,
                         InterviewStatus.NOT_SCHEDULED,
                         InterviewStatus.IN_PROGRESS,
                     ]
                 ),
-                None,
             )
-            if active_interview:
-                # Update existing active interview
-                active_interview.status = InterviewStatus.SCHEDULED
-                active_interview.email_datetime = scheduled_datetime
-                active_interview.interview_datetime = None
-            else:
-                # All existing interviews are COMPLETED, create a new one
-                interview: InterviewORM = InterviewORM(
-                    candidate_id=candidate_id,
+            rescheduled_ids = set(
+                self._db_session.execute(
+                    select(distinct(InterviewORM.candidate_id)).where(
+                        *active_interviews
+                    )
+                ).scalars()
+            )
+            # Reschedule the existing active interviews in place
+            self._db_session.execute(
+                update(InterviewORM)
+                .where(*active_interviews)
+                .values(
                     status=InterviewStatus.SCHEDULED,
                     email_datetime=scheduled_datetime,
+                    interview_datetime=None,
                 )
-                self._db_session.add(interview)
-            self._db_session.commit()
-
-            with open(
-                os.path.join("user_management", "src", "candidate_invite.html"),
-                "r",
-                encoding="utf-8",
-            ) as f:
-                email_template: Template = Template(f.read())
-            email_body: str = email_template.render(
-                applicant=candidate.name,
-                username=candidate.email,
-                password=current_password,
+                .execution_options(synchronize_session=False)
             )
-            EmailHelper(candidate.email).send_candidate_invite(email_body)
-            return True
-
-    def __create_candidate(self, candidate_info: CandidateInfo) -> None:
-        logger.info("Candidate creation request received")
-        self.user_profile = candidate_info
-        try:
-            with self:
-                if self._user_exists():
-                    raise UserExistsException(candidate_info.email)
-
-                new_user = CandidateORM(
-                    role="Candidate",
-                    name=candidate_info.name,
-                    email=candidate_info.email,
-                    grade=candidate_info.grade,
-                    location=candidate_info.location,
-                    skill=candidate_info.skill,
-                    designation=candidate_info.designation,
-                    department=candidate_info.department,
-                )
-
-                self._db_session.add(new_user)
-                self._db_session.flush()  # Commit first to get the ID
-                new_interview = InterviewORM(
-                    candidate_id=new_user.id,
-                    status=InterviewStatus.NOT_SCHEDULED,
+            # Candidates whose interviews are all COMPLETED get a new one
+            self._db_session.bulk_insert_mappings(
+                InterviewORM,
+                [
+                    {
+                        "candidate_id": candidate_id,
+                        "status": InterviewStatus.SCHEDULED,
+                        "email_datetime": scheduled_datetime,
+                    }
+                    for candidate_id in invited_ids
+                    if candidate_id not in rescheduled_ids
+                ],
+            )
+            self._db_session.commit()
+            CacheHelper.clear(CacheNamespace.REPORTING)
+            CacheHelper.clear(CacheNamespace.DASHBOARD)
+
+            email_helper = None
+            emailed_ids = []
+            for candidate in candidates:
+                email_body: str = INVITE_TEMPLATE.render(
+                    applicant=candidate.name,
+                    username=candidate.email,
+                    password=passwords[candidate.id],
                 )
-                self._db_session.add(new_interview)
-                self._db_session.commit()
-                logger.info("Candidate %s created successfully", candidate_info.email)
-        except SQLAlchemyError as e:
-            # No need for explicit rollback, handled by context manager
-            logger.error("Database error occurred: %s", e)
-            raise e
+                try:
+                    if email_helper is None:
+                        email_helper = EmailHelper(candidate.email)
+                    email_helper.send_candidate_invite(email_body, candidate.email)
+                except OSError as e:  # SMTPException is an OSError as well
+                    logger.error(
+                        "Invite to candidate %s could not be sent: %s",
+                        candidate.id,
+                        e,
+                    )
+                    # The session may be broken, the next invite opens a new one
+                    email_helper = None
+                    continue
+                emailed_ids.append(candidate.id)
+            return emailed_ids
 
     def generate_password(self, length: int = None) -> str:
         """
@@ -434,9 +658,16 @@ class Admin(User):
             str: The generated password as a string.
         """
         if length is None:
-            length = self._config["password_length"]
-        alphabet = string.ascii_letters + string.digits + string.punctuation
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+            length = self._MIN_PASSWORD_LEN
+        password = []
+        while len(password) < length:
+            # Draw the random bytes for the whole password at once
+            password.extend(
+                PASSWORD_ALPHABET[byte % len(PASSWORD_ALPHABET)]
+                for byte in secrets.token_bytes(2 * length)
+                if byte < PASSWORD_BYTE_LIMIT
+            )
+        return "".join(password[:length])
 
     def get_candidate(self, candidate_id: int) -> CandidateResponseInfo:
         """
@@ -465,17 +696,55 @@ class Admin(User):
                 raise RecordNotFoundException(
                     candidate_id, message="Candidate not found"
                 )
-            return CandidateResponseInfo(
-                id=candidate.id,
-                name=candidate.name,
-                email=candidate.email,
-                grade=candidate.grade,
-                location=candidate.location,
-                skill=candidate.skill,
-                designation=candidate.designation,
-                department=candidate.department,
-                resume=candidate.resume,
-            )
+            return CandidateResponseInfo.model_validate(candidate)
+
+    @staticmethod
+    def __search_conditions(search_text: str) -> list:
+        """
+        Build the search filters for the given text.
+
+        The text columns are matched through the FULLTEXT indexes on Users and
+        Candidates as word prefixes in boolean mode. Words are reduced to their
+        alphanumeric tokens so user input cannot inject boolean-mode operators.
+        """
+        words = [
+            word
+            for word in re.findall(r"\w+", search_text)
+            if len(word) >= FULLTEXT_MIN_TOKEN_SIZE
+        ]
+        if words:
+            against = " ".join(f"+{word}*" for word in words)
+            conditions = [
+                match(
+                    CandidateORM.name, CandidateORM.email, against=against
+                ).in_boolean_mode(),
+                match(
+                    CandidateORM.skill,
+                    CandidateORM.designation,
+                    CandidateORM.department,
+                    CandidateORM.location,
+                    CandidateORM.grade,
+                    against=against,
+                ).in_boolean_mode(),
+            ]
+        else:
+            # Too short for the FULLTEXT indexes.
+            pattern = f"%{search_text}%"
+            conditions = [
+                column.like(pattern)
+                for column in (
+                    CandidateORM.name,
+                    CandidateORM.email,
+                    CandidateORM.skill,
+                    CandidateORM.designation,
+                    CandidateORM.department,
+                    CandidateORM.location,
+                    CandidateORM.grade,
+                )
+            ]
+        if search_text.isdigit():
+            conditions.append(CandidateORM.id == int(search_text))
+        return conditions
 
     def search_candidates(self, search_text: str) -> List[CandidateResponseInfo]:
         """
@@ -491,38 +760,13 @@ class Admin(User):
         Returns:
         - List[CandidateResponseInfo]: A list of candidate profiles matching the search text.
         """
-        search_text = search_text.strip().lower()
+        search_text = search_text.strip()
         logger.info("Searching for candidates with text: %s", search_text)
-        query = self.__fetch_all_candidates_with_latest_status()
         with self:
-            candidates = query.filter(
-                or_(
-                    func.lower(CandidateORM.id).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.name).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.email).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.skill).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.designation).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.department).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.location).ilike(f"%{search_text}%"),
-                    func.lower(CandidateORM.grade).ilike(f"%{search_text}%"),
-                )
-            ).all()
+            query = self.__fetch_all_candidates_with_latest_status()
+            if search_text:
+                query = query.filter(or_(*self.__search_conditions(search_text)))
+            candidates = query.all()
             logger.info("Search results: %d", len(candidates))
-            response_data = [
-                CandidateResponseInfo(
-                    id=candidate.id,
-                    name=candidate.name,
-                    email=candidate.email,
-                    grade=candidate.grade,
-                    location=candidate.location,
-                    skill=candidate.skill,
-                    designation=candidate.designation,
-                    department=candidate.department,
-                    interview_status=(
-                        interview_status.value if interview_status else None
-                    ),
-                    resume=candidate.resume,
-                )
-                for candidate, interview_status in candidates
-            ]
+            response_data = self.__to_response_info(candidates)
             return response_data
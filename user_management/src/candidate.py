@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
 
-from commons import ConfigLoader, InterviewStatus, RecordNotFoundException, logger
+from commons import InterviewStatus, RecordNotFoundException, logger
 from interview import InterviewORM
 from user_management.models.candidate import CandidateORM
 from user_management.src.user import User
@@ -25,11 +25,8 @@ class Candidate(User):
     specific to candidates, such as managing candidate data and interactions.
     """
 
-    __CONFIG_PATH = os.path.join("commons", "config.jsonc")
-
     def __init__(self, user_id: int = None, db_helper=None):
         super().__init__(user_id, db_helper)
-        self.__config = ConfigLoader.get_config(self.__CONFIG_PATH)
         if user_id:
             self.user_id = user_id
             self._set_user_record_by_id()
@@ -48,24 +45,24 @@ class Candidate(User):
 
         """
         with self:
-            interview = (
-                self._db_session.query(InterviewORM)
+            # Only the timestamp is needed, the interview row is not loaded
+            email_datetime = (
+                self._db_session.query(InterviewORM.email_datetime)
                 .filter(InterviewORM.candidate_id == self.user_id)
                 .filter(InterviewORM.status == InterviewStatus.SCHEDULED.value)
-                .first()
+                .limit(1)
+                .scalar()
             )
-            if not interview:
-                return True
-
-            if datetime.now() > (
-                interview.email_datetime
-                + timedelta(hours=self.__config["email_expiration_hours"])
-            ):
-                self.deactivate()
-                logger.warning(
-                    "Candidate %s's interview period has expired.", self.user_id
-                )
-                return True
+        if email_datetime is None:
+            return True
+
+        if datetime.now() > (
+            email_datetime + timedelta(hours=self._CONFIG["email_expiration_hours"])
+        ):
+            # Deactivated only once expired, so the common path is one SELECT
+            self.deactivate()
+            logger.warning("Candidate %s's interview period has expired.", self.user_id)
+            return True
         return False
 
     def _set_user_record_by_id(self):
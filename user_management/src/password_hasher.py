@@ -0,0 +1,94 @@
+"""Password hashing for user credentials.
+
+New hashes use bcrypt, which runs in compiled code. Hashes created earlier with
+Werkzeug's generate_password_hash are still verified, so existing users can log
+in; they are replaced with bcrypt hashes on their next successful login.
+"""
+
+import re
+import secrets
+import time
+from functools import cache
+
+import bcrypt
+from werkzeug.security import check_password_hash
+
+BCRYPT_ROUNDS = 12
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+# $2?$<rounds>$ followed by the 22 character salt and 31 character checksum.
+# Malformed hashes are rejected up front, as some make bcrypt panic.
+BCRYPT_HASH_PATTERN = re.compile(r"\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}")
+VERIFY_TIMING_SAMPLES = 3
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt."""
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("ascii")
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    """
+    Check a password against a bcrypt or legacy Werkzeug hash.
+
+    A missing or malformed hash fails without any hashing, so that failure is
+    padded to the time of a real verification and can't be spotted by timing.
+    """
+    if password_hash and BCRYPT_HASH_PATTERN.fullmatch(password_hash):
+        try:
+            return bcrypt.checkpw(
+                password.encode("utf-8"), password_hash.encode("ascii")
+            )
+        except ValueError:
+            # Invalid cost, or a password longer than bcrypt accepts
+            pass
+    elif (
+        password_hash
+        and not password_hash.startswith(BCRYPT_PREFIXES)
+        and password_hash.count("$") >= 2
+    ):
+        # Werkzeug hashes look like <method>$<salt>$<hash>
+        try:
+            return check_password_hash(password_hash, password)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Malformed hash, e.g. an unknown method
+            pass
+    wait_as_if_verifying()
+    return False
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Whether the hash is a legacy Werkzeug hash or uses fewer bcrypt rounds."""
+    if not password_hash.startswith(BCRYPT_PREFIXES):
+        return True
+    # bcrypt hashes look like $2b$<rounds>$<salt and checksum>
+    return int(password_hash[4:6]) < BCRYPT_ROUNDS
+
+
+@cache
+def verify_seconds() -> float:
+    """
+    Average time of a bcrypt verification at the configured cost.
+
+    Measured on first use rather than at import, so processes that never
+    check a password don't pay for the sample hashes.
+    """
+    password = secrets.token_urlsafe(16)
+    password_hash = hash_password(password)
+    started = time.perf_counter()
+    for _ in range(VERIFY_TIMING_SAMPLES):
+        verify_password(password_hash, password)
+    return (time.perf_counter() - started) / VERIFY_TIMING_SAMPLES
+
+
+def wait_as_if_verifying() -> None:
+    """
+    Take as long as a password verification without doing the hashing.
+
+    Used when a login names an unknown user, so the response can't be told
+    apart from a wrong password by its timing, and so unknown emails can't be
+    used to make the server burn CPU on hashing. The calling thread still
+    blocks for that long.
+    """
+    time.sleep(verify_seconds())
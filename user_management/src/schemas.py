@@ -1,6 +1,16 @@
 """Schemas for the user service"""
 
-from pydantic import BaseModel, EmailStr, Field, SecretStr, StrictStr, field_validator
+from typing import Optional
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    SecretStr,
+    StrictStr,
+    field_validator,
+)
 
 
 # pylint: disable=no-self-argument
@@ -68,9 +78,12 @@ class CandidateInfo(BaseModel):
 class CandidateResponseInfo(CandidateInfo):
     """Candidate profile response model"""
 
+    # Allows building the response straight from a CandidateORM instance.
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     resume: int | None
-    interview_status: StrictStr
+    interview_status: Optional[StrictStr] = None
 
 
 class ChangePasswordRequest(BaseModel):
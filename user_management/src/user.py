@@ -1,28 +1,96 @@
 """Abstract class for all users."""
 
 import os
-import re
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
 
-from sqlalchemy import exists
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from commons import (
     AuthenticationException,
     AuthorizationException,
+    CacheHelper,
+    CacheNamespace,
     ConfigLoader,
     DBEnterExitMixin,
     RecordNotFoundException,
+    UserRole,
     logger,
 )
 from user_management.models import UserORM
+from user_management.src.password_hasher import (
+    hash_password,
+    needs_rehash,
+    verify_password,
+    wait_as_if_verifying,
+)
 from user_management.src.schemas import ChangePasswordRequest
 
+# How long a user's role and active flag are trusted for authorization checks
+AUTH_CACHE_TTL_SECONDS = 30
+CacheHelper.get_cache(CacheNamespace.AUTH, ttl=AUTH_CACHE_TTL_SECONDS)
+# The login lookup, written out so the ORM doesn't build it on every login.
+# .columns() keeps the result typed (role as UserRole, is_active as bool).
+_LOGIN_SELECT = text(
+    "SELECT id, name, role, is_active, passwordhash FROM Users "
+    "WHERE email = :email LIMIT 1"
+).columns(
+    UserORM.id,
+    UserORM.name,
+    UserORM.role,
+    UserORM.is_active,
+    UserORM.passwordhash,
+)
+# bcrypt releases the GIL, so batched password checks run on several cores
+_PASSWORD_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="password_verify")
+
+PASSWORD_MIN_LENGTH = 8
+PASSWORD_MAX_LENGTH = 20
+PASSWORD_SPECIAL_CHARACTERS = frozenset("~@$!%*?&#^()")
+PASSWORD_ALLOWED_CHARACTERS = PASSWORD_SPECIAL_CHARACTERS.union(
+    string.ascii_letters + string.digits
+)
+
+
+class LoginResult(NamedTuple):
+    """The authenticated user's details returned by User.login."""
+
+    id: int
+    name: str
+    role: UserRole
+
+
+def _meets_password_policy(password: str) -> bool:
+    """
+    Check the password has a lowercase letter, an uppercase letter, a digit and a
+    special character, and nothing else, in a single pass over its characters.
+    """
+    if not PASSWORD_MIN_LENGTH <= len(password) <= PASSWORD_MAX_LENGTH:
+        return False
+    has_lower = has_upper = has_digit = has_special = False
+    for char in password:
+        if char not in PASSWORD_ALLOWED_CHARACTERS:
+            return False
+        if char in PASSWORD_SPECIAL_CHARACTERS:
+            has_special = True
+        elif char.islower():
+            has_lower = True
+        elif char.isupper():
+            has_upper = True
+        else:
+            has_digit = True
+    return has_lower and has_upper and has_digit and has_special
+
 
 class User(DBEnterExitMixin):
     """Abstract class for all users."""
 
     __CONFIG_PATH = os.path.join("commons", "config.jsonc")
+    # Loaded once at import rather than per instance
+    _CONFIG = ConfigLoader.get_config(__CONFIG_PATH)
+    _MIN_PASSWORD_LEN = _CONFIG["password_length"]
 
     def __init__(self, user_id: int = None, db_helper=None):
 
@@ -30,9 +98,8 @@ class User(DBEnterExitMixin):
         self.user_profile: UserORM = None
         self._db_helper = db_helper
         self._db_session = None
-        self._config = ConfigLoader.get_config(self.__CONFIG_PATH)
 
-    def login(self, email: str, password: str) -> None:
+    def login(self, email: str, password: str) -> LoginResult:
         """Authenticate a user by their email and password.
 
         This method checks whether a user with the given email exists in the database
@@ -44,44 +111,97 @@ class User(DBEnterExitMixin):
             password (str): The plaintext password provided by the user.
 
         Returns:
-            Tuple[int, str, str]: A tuple containing user ID, name, and role.
+            LoginResult: A named tuple containing user ID, name, and role.
 
         Raises:
             AuthenticationException: If authentication fails due to incorrect email
             or password.
             AuthorizationException: If the user is not active or the email verification period has expired.
         """
-        try:
-            user = self.__get_user_record_by_email(email)
-        except RecordNotFoundException as exc:
-            raise AuthenticationException(email) from exc
         with self:
+            try:
+                user = self.__get_user_record_by_email(email)
+            except RecordNotFoundException as exc:
+                # Take as long as a hash check, so unknown emails can't be told
+                # apart from wrong passwords by response time
+                wait_as_if_verifying()
+                raise AuthenticationException(email) from exc
             if not user.is_active:
                 logger.warning("User %s attempted to log in but is inactive.", email)
                 raise AuthorizationException(email, message="User is not active !")
-            if check_password_hash(user.passwordhash, password):
+            if verify_password(user.passwordhash, password):
                 logger.info("User %s authentication successful", email)
-                return (user.id, user.name, user.role)
+                login_result = LoginResult(user.id, user.name, user.role)
+                if needs_rehash(user.passwordhash):
+                    # Migrate legacy hashes while the plaintext is at hand
+                    self._db_session.query(UserORM).filter(
+                        UserORM.id == user.id
+                    ).update({"passwordhash": hash_password(password)})
+                    logger.info("User %s password rehashed", email)
+                return login_result
             logger.warning(
                 "User %s authentication failed due to incorrect username or password.",
                 email,
             )
             raise AuthenticationException(email)
 
-    def _user_exists(self) -> bool:
-        user_exists = self._db_session.query(
-            exists().where(UserORM.email == self.user_profile.email)
-        ).scalar()
-        return user_exists
+    def login_many(
+        self, credentials: List[Tuple[str, str]]
+    ) -> List[Optional[LoginResult]]:
+        """Authenticate several users by their email and password at once.
 
-    def __get_user_record_by_email(self, email):
+        All users are fetched with a single query and the passwords are verified
+        in parallel.
+
+        Args:
+            credentials (List[Tuple[str, str]]): (email, password) pairs.
+
+        Returns:
+            List[Optional[LoginResult]]: The result for each pair, in order, or None
+            when the email is unknown, the user is inactive or the password is wrong.
+        """
+        emails = list({email for email, _ in credentials})
         with self:
-            user = (
-                self._db_session.query(UserORM).filter(UserORM.email == email).first()
-            )
-            if user:
-                return user
-            raise RecordNotFoundException(email)
+            # Keyed casefolded, as the IN lookup follows the case-insensitive
+            # collation and may return the email in a different case
+            users = {
+                user.email.casefold(): user
+                for user in self._db_session.query(
+                    UserORM.email,
+                    UserORM.id,
+                    UserORM.name,
+                    UserORM.role,
+                    UserORM.is_active,
+                    UserORM.passwordhash,
+                ).filter(UserORM.email.in_(emails))
+            }
+
+        def check(credential: Tuple[str, str]) -> Optional[LoginResult]:
+            email, password = credential
+            user = users.get(email.casefold())
+            if user is None:
+                # Same timing as a wrong password, as in login
+                wait_as_if_verifying()
+                return None
+            if user.is_active and verify_password(user.passwordhash, password):
+                return LoginResult(user.id, user.name, user.role)
+            return None
+
+        results = list(_PASSWORD_EXECUTOR.map(check, credentials))
+        logger.info(
+            "Batch login: %d of %d authenticated",
+            sum(result is not None for result in results),
+            len(credentials),
+        )
+        return results
+
+    def __get_user_record_by_email(self, email):
+        """Look up the user by email; the caller must hold an open session."""
+        # Only the columns login needs, as a plain row
+        user = self._db_session.execute(_LOGIN_SELECT, {"email": email}).first()
+        if user:
+            return user
+        raise RecordNotFoundException(email)
 
     def _set_user_record_by_id(self):
         if not self._id:
@@ -95,51 +215,52 @@ class User(DBEnterExitMixin):
 
     def deactivate(self) -> None:
         """Deactivate a user."""
+        user_id, email = self.user_profile.id, self.user_profile.email
         try:
             with self:
-                self._db_session.query(UserORM).filter(
-                    UserORM.email == self.user_profile.email
-                ).update({"is_active": False})
-                self._db_session.commit()
-                logger.info("User %s deactivated", self.user_profile.email)
+                # Flushes as an UPDATE by primary key on the loaded user,
+                # committed when the block exits
+                self._db_session.add(self.user_profile)
+                self.user_profile.is_active = False
         except SQLAlchemyError as e:
             logger.error("Database error occurred: %s", e)
             raise e
+        # Drop cached authorization so the change applies immediately
+        CacheHelper.pop(CacheNamespace.AUTH, user_id)
+        logger.info("User %s deactivated", email)
 
     def set_password(self, request: ChangePasswordRequest) -> None:
         """Set the user's password."""
         if not self._id:
             raise ValueError("User ID is required")
-        self._set_user_record_by_id()
-        # Check if the old password is correct
-        if not check_password_hash(
-            self.user_profile.passwordhash, request.current_password.get_secret_value()
-        ):
-            logger.warning(
-                "User %s provided incorrect current password", self.user_profile.email
-            )
-            raise AuthenticationException(
-                self.user_profile.email, "Current password is incorrect"
-            )
+        # Check strength and minimum requirements first, they cost far less
+        # than loading the user and verifying the current password
         new_password = request.new_password.get_secret_value()
-        # Check strength and minimum requirements
-        if len(new_password) < self._config["password_length"]:
-            raise ValueError(
-                f"Password must be at least {self._config['password_length']} characters long"
-            )
-        if not re.match(
-            r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[~@$!%*?&#^()])[A-Za-z\d~@$!%*?&#^()]{8,20}$",
-            new_password,
-        ):
+        # Both values come from the caller, so this needs no hashing or lookup
+        if new_password == request.current_password.get_secret_value():
+            raise ValueError("New password must differ from the current password")
+        min_length = self._MIN_PASSWORD_LEN
+        if len(new_password) < min_length:
+            raise ValueError(f"Password must be at least {min_length} characters long")
+        if not _meets_password_policy(new_password):
             raise ValueError(
                 "Password must contain at least one uppercase letter, one lowercase letter, one digit, and one special character"
                 "(Allowed special characters: ~!@#$%^&*()_+\-=[\]{}|\\;':,./?)"
                 "Must be between 8 and 20 characters long"
             )
         with self:
-            # Update the password hash
-            self._db_session.query(UserORM).filter(UserORM.id == self._id).update(
-                {"passwordhash": generate_password_hash(new_password)}
-            )
-            self._db_session.commit()
-            logger.info("User %s password updated", self.user_profile.email)
+            # Load, verify and update the user in one session and transaction
+            self.user_profile = self._db_session.get(UserORM, self._id)
+            if not self.user_profile:
+                raise RecordNotFoundException(self._id)
+            email = self.user_profile.email
+            # Check if the old password is correct
+            if not verify_password(
+                self.user_profile.passwordhash,
+                request.current_password.get_secret_value(),
+            ):
+                logger.warning("User %s provided incorrect current password", email)
+                raise AuthenticationException(email, "Current password is incorrect")
+            # Flushes as an UPDATE by primary key when the block commits
+            self.user_profile.passwordhash = hash_password(new_password)
+        logger.info("User %s password updated", email)